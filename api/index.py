@@ -19,6 +19,8 @@ if os.environ.get("VERCEL"):
     _src_db = os.path.join(ROOT, "fraud_detection.db")
     _dst_db = "/tmp/fraud_detection.db"
     if not os.path.exists(_dst_db) and os.path.exists(_src_db):
+        # A real copy, never a link: writes must not reach the bundled file.
+        # copy2 already copies in-kernel (sendfile/copy_file_range) on Linux.
         shutil.copy2(_src_db, _dst_db)
     # Must be set before src.config is imported (Settings reads env at class-creation time)
     os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:////tmp/fraud_detection.db")
@@ -14,16 +14,28 @@ Output:
 
 from __future__ import annotations
 
+import calendar
+import heapq
+import itertools
 import json
 import os
 import random
-import uuid
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+from operator import itemgetter
 from pathlib import Path
 from typing import Final
 
+import numpy as np
 from faker import Faker
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speed-up
+    orjson = None
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
@@ -31,6 +43,11 @@ from faker import Faker
 fake = Faker(["id_ID", "en_US"])
 
 BASE_DATE: Final[datetime] = datetime(2024, 1, 15, 0, 0, 0)
+BASE_DATE_PREFIX: Final[str] = BASE_DATE.date().isoformat()
+# BASE_DATE is a naive UTC datetime; its POSIX seconds are the base that
+# generated integer timestamps are offset from.
+BASE_EPOCH: Final[int] = calendar.timegm(BASE_DATE.timetuple())
+TWO_DIGITS: Final[list[str]] = [f"{i:02d}" for i in range(60)]
 
 COUNTRIES: Final[list[str]] = ["ID", "SG", "MY", "TH", "PH"]
 COUNTRY_WEIGHTS: Final[list[float]] = [0.65, 0.12, 0.10, 0.08, 0.05]
@@ -44,6 +61,17 @@ PRODUCT_WEIGHTS: Final[list[float]] = [0.30, 0.35, 0.15, 0.20]
 STATUSES: Final[list[str]] = ["APPROVED", "SOFT_DECLINED", "HARD_DECLINED"]
 STATUS_WEIGHTS: Final[list[float]] = [0.80, 0.10, 0.10]
 
+QUANTITIES: Final[list[int]] = [1, 2, 3]
+QUANTITY_WEIGHTS: Final[list[float]] = [0.7, 0.2, 0.1]
+
+# Cumulative weights, computed once so ``random.choices`` can skip its own
+# ``itertools.accumulate`` pass on every call.
+PAYMENT_CUM: Final[list[float]] = list(itertools.accumulate(PAYMENT_WEIGHTS))
+PRODUCT_CUM: Final[list[float]] = list(itertools.accumulate(PRODUCT_WEIGHTS))
+COUNTRY_CUM: Final[list[float]] = list(itertools.accumulate(COUNTRY_WEIGHTS))
+STATUS_CUM: Final[list[float]] = list(itertools.accumulate(STATUS_WEIGHTS))
+QTY_CUM: Final[list[float]] = list(itertools.accumulate(QUANTITY_WEIGHTS))
+
 AMOUNT_RANGES: Final[dict[str, tuple[float, float]]] = {
     "LAPTOP": (400.0, 2500.0),
     "SMARTPHONE": (150.0, 1200.0),
@@ -58,8 +86,35 @@ UNIT_PRICE_RANGES: Final[dict[str, tuple[float, float]]] = {
     "ACCESSORIES": (5.0, 75.0),
 }
 
+EMAIL_DOMAINS: Final[tuple[str, ...]] = (
+    "gmail.com",
+    "yahoo.com",
+    "outlook.com",
+    "hotmail.com",
+    "proton.me",
+)
+
+# First octets of public unicast IPv4 space (drops 0/8, 10/8, 127/8 and the
+# /8s containing 169.254/16, 172.16/12 and 192.168/16).
+PUBLIC_FIRST_OCTETS: Final[tuple[int, ...]] = tuple(
+    o for o in range(1, 224) if o not in (10, 127, 169, 172, 192)
+)
+
+# WIB peak hours converted to UTC: 18-23 WIB = 11-16 UTC, 09-12 WIB = 02-05 UTC
+PEAK_HOUR_RANGES: Final[list[tuple[int, int]]] = [(11, 16), (2, 5)]
+PEAK_PROBABILITY: Final[float] = 0.55
+
+# Structure-of-arrays view of the ranges above, indexed by category id, for
+# the vectorized generator.
+CATEGORY_IDS: Final[dict[str, int]] = {cat: i for i, cat in enumerate(PRODUCT_CATEGORIES)}
+AMOUNT_LOW: Final[np.ndarray] = np.array([AMOUNT_RANGES[c][0] for c in PRODUCT_CATEGORIES])
+AMOUNT_HIGH: Final[np.ndarray] = np.array([AMOUNT_RANGES[c][1] for c in PRODUCT_CATEGORIES])
+UP_LOW: Final[np.ndarray] = np.array([UNIT_PRICE_RANGES[c][0] for c in PRODUCT_CATEGORIES])
+UP_HIGH: Final[np.ndarray] = np.array([UNIT_PRICE_RANGES[c][1] for c in PRODUCT_CATEGORIES])
+
 VISA_BINS: Final[list[str]] = ["411111", "424242", "456789", "478012", "492150"]
 MASTERCARD_BINS: Final[list[str]] = ["512345", "523456", "545454", "555555", "534210"]
+ALL_CARD_BINS: Final[tuple[str, ...]] = tuple(VISA_BINS + MASTERCARD_BINS)
 
 SUSPICIOUS_BINS: Final[list[str]] = [
     "412345",
@@ -70,17 +125,59 @@ SUSPICIOUS_BINS: Final[list[str]] = [
     "551234",
 ]
 
+# Number of Faker emails drawn per run for the fraud-pattern generators;
+# the patterns use at most 60 distinct identities between them.
+EMAIL_POOL_SIZE: Final[int] = 128
+
+# Clean-transaction counts at or above this are split across worker
+# processes; below it, fork and pickling overhead outweighs the gain.
+PARALLEL_THRESHOLD: Final[int] = 100_000
+
+# Clean rows built per step when streaming the dataset with ``iter_dataset``.
+STREAM_CHUNK_SIZE: Final[int] = 1_000
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
+def _format_uuid4(h: str) -> str:
+    """Format 32 random hex digits as a canonical UUID4 string.
+
+    Sets the version nibble and variant bits so the result is a valid
+    RFC 4122 version-4 UUID, without building a ``uuid.UUID`` object.
+
+    Args:
+        h: 32 lowercase hex characters of random data.
+
+    Returns:
+        A ``xxxxxxxx-xxxx-4xxx-yxxx-xxxxxxxxxxxx`` string.
+    """
+    variant = "89ab"[int(h[16], 16) & 0x3]
+    return f"{h[0:8]}-{h[8:12]}-4{h[13:16]}-{variant}{h[17:20]}-{h[20:32]}"
+
+
 def _uuid() -> str:
     """Generate a new UUID4 string."""
-    return str(uuid.uuid4())
+    return _format_uuid4(os.urandom(16).hex())
+
+
+def _format_timestamp(ts: int | datetime) -> str:
+    """Format a POSIX-seconds or naive datetime timestamp as ISO 8601.
+
+    Args:
+        ts: Integer seconds (as returned by ``_random_timestamp``) or a
+            naive UTC datetime.
 
+    Returns:
+        A ``YYYY-MM-DDTHH:MM:SS`` string.
+    """
+    if isinstance(ts, datetime):
+        return ts.isoformat(timespec="seconds")
+    return (BASE_DATE + timedelta(seconds=ts - BASE_EPOCH)).isoformat(timespec="seconds")
 
-def _random_timestamp(hour_start: int = 0, hour_end: int = 24) -> datetime:
+
+def _random_timestamp(hour_start: int = 0, hour_end: int = 24) -> int:
     """Return a random timestamp within a given hour range on BASE_DATE.
 
     Applies a two-peak distribution that concentrates traffic at
@@ -91,14 +188,14 @@ def _random_timestamp(hour_start: int = 0, hour_end: int = 24) -> datetime:
         hour_end: Latest hour (UTC, exclusive).
 
     Returns:
-        A datetime within the specified window.
+        POSIX seconds within the specified window.  Kept as an ``int`` so
+        callers can offset it with plain addition; it is only converted to a
+        string by ``_format_timestamp``.
     """
-    # WIB peak hours converted to UTC: 18-23 WIB = 11-16 UTC, 09-12 WIB = 02-05 UTC
-    peak_ranges = [(11, 16), (2, 5)]
-    use_peak = random.random() < 0.55
+    use_peak = random.random() < PEAK_PROBABILITY
 
     if use_peak:
-        peak = random.choice(peak_ranges)
+        peak = random.choice(PEAK_HOUR_RANGES)
         effective_start = max(hour_start, peak[0])
         effective_end = min(hour_end, peak[1])
         if effective_start < effective_end:
@@ -110,17 +207,52 @@ def _random_timestamp(hour_start: int = 0, hour_end: int = 24) -> datetime:
 
     minute = random.randint(0, 59)
     second = random.randint(0, 59)
-    return BASE_DATE.replace(hour=hour, minute=minute, second=second)
+    return BASE_EPOCH + hour * 3600 + minute * 60 + second
 
 
 def _random_email() -> str:
-    """Generate a plausible customer email address."""
-    return fake.email()
+    """Generate a plausible customer email address.
+
+    Hand-rolled rather than ``fake.email()``: this runs once per clean
+    transaction and Faker's provider dispatch dominates its cost.  The
+    fraud-pattern generators keep Faker addresses via ``_pattern_emails``.
+    """
+    return f"user{random.randrange(10**9)}@{random.choice(EMAIL_DOMAINS)}"
+
+
+def _email_stream() -> Iterator[str]:
+    """Return the fraud-pattern identities for one dataset run.
+
+    The pattern generators want Faker-quality addresses but only need a few
+    dozen per run, so a pool is drawn from the (currently seeded) ``fake``
+    once per run and handed out in shuffled order.  Drawing without
+    replacement keeps every identity in a single pattern, so e.g. a "first
+    purchase" customer never carries another pattern's history.
+    """
+    pool = list(dict.fromkeys(fake.email() for _ in range(EMAIL_POOL_SIZE)))
+    random.shuffle(pool)
+    return iter(pool)
+
+
+def _pattern_emails(k: int, emails: Iterator[str]) -> list[str]:
+    """Take the next *k* identities from the run's email stream.
+
+    Args:
+        k: Number of distinct identities the pattern needs.
+        emails: Stream from ``_email_stream`` shared by the run's patterns.
+
+    Returns:
+        A list of *k* unique email addresses.
+    """
+    return list(itertools.islice(emails, k))
 
 
 def _random_ip() -> str:
-    """Generate a plausible IPv4 address."""
-    return fake.ipv4_public()
+    """Generate a plausible public IPv4 address."""
+    return (
+        f"{random.choice(PUBLIC_FIRST_OCTETS)}.{random.randrange(256)}."
+        f"{random.randrange(256)}.{random.randrange(256)}"
+    )
 
 
 def _random_card_bin(payment_method: str) -> str | None:
@@ -132,22 +264,19 @@ def _random_card_bin(payment_method: str) -> str | None:
     Returns:
         A BIN string or None.
     """
-    if payment_method != "CREDIT_CARD":
-        return None
-    all_bins = VISA_BINS + MASTERCARD_BINS
-    return random.choice(all_bins)
+    return random.choice(ALL_CARD_BINS) if payment_method == "CREDIT_CARD" else None
 
 
 def _device_fingerprint() -> str | None:
     """Return a random hex device fingerprint or None."""
     if random.random() < 0.15:
         return None
-    return uuid.uuid4().hex[:16]
+    return os.urandom(8).hex()
 
 
 def _build_transaction(
     *,
-    timestamp: datetime | None = None,
+    timestamp: int | datetime | None = None,
     email: str | None = None,
     ip: str | None = None,
     billing_country: str | None = None,
@@ -169,19 +298,27 @@ def _build_transaction(
     Returns:
         A dictionary matching the required transaction schema.
     """
-    ts = timestamp or _random_timestamp()
-    pm = payment_method or random.choices(PAYMENT_METHODS, weights=PAYMENT_WEIGHTS, k=1)[0]
-    cat = product_category or random.choices(PRODUCT_CATEGORIES, weights=PRODUCT_WEIGHTS, k=1)[0]
-    bc = billing_country or random.choices(COUNTRIES, weights=COUNTRY_WEIGHTS, k=1)[0]
+    ts = timestamp if timestamp is not None else _random_timestamp()
+    pm = payment_method or random.choices(PAYMENT_METHODS, cum_weights=PAYMENT_CUM, k=1)[0]
+    cat = product_category or random.choices(PRODUCT_CATEGORIES, cum_weights=PRODUCT_CUM, k=1)[0]
+    bc = billing_country or random.choices(COUNTRIES, cum_weights=COUNTRY_CUM, k=1)[0]
     sc = shipping_country if shipping_country is not None else bc
-    st = status or random.choices(STATUSES, weights=STATUS_WEIGHTS, k=1)[0]
+    st = status or random.choices(STATUSES, cum_weights=STATUS_CUM, k=1)[0]
 
-    low, high = AMOUNT_RANGES[cat]
-    amt = amount_usd if amount_usd is not None else round(random.uniform(low, high), 2)
+    # Round once here; overrides may arrive unrounded from callers.
+    if amount_usd is not None:
+        amt = round(float(amount_usd), 2)
+    else:
+        low, high = AMOUNT_RANGES[cat]
+        amt = round(random.uniform(low, high), 2)
 
-    up_low, up_high = UNIT_PRICE_RANGES[cat]
-    up = unit_price if unit_price is not None else round(random.uniform(up_low, up_high), 2)
-    qty = quantity if quantity is not None else random.choices([1, 2, 3], weights=[0.7, 0.2, 0.1], k=1)[0]
+    if unit_price is not None:
+        up = round(float(unit_price), 2)
+    else:
+        up_low, up_high = UNIT_PRICE_RANGES[cat]
+        up = round(random.uniform(up_low, up_high), 2)
+
+    qty = quantity if quantity is not None else random.choices(QUANTITIES, cum_weights=QTY_CUM, k=1)[0]
 
     cb = card_bin if card_bin is not None else _random_card_bin(pm)
     fp = is_first_purchase if is_first_purchase is not None else (random.random() < 0.30)
@@ -195,50 +332,107 @@ def _build_transaction(
 
     return {
         "transaction_id": _uuid(),
-        "timestamp": ts.strftime("%Y-%m-%dT%H:%M:%S"),
+        "timestamp": _format_timestamp(ts),
         "customer_email": email or _random_email(),
         "customer_ip": ip or _random_ip(),
         "billing_country": bc,
         "shipping_country": sc,
         "card_bin": cb,
         "payment_method": pm,
-        "amount_usd": round(float(amt), 2),
+        "amount_usd": amt,
         "status": st,
         "product_category": cat,
         "quantity": qty,
-        "unit_price": round(float(up), 2),
+        "unit_price": up,
         "device_fingerprint": dfp,
         "is_first_purchase": fp,
     }
 
 
+def _build_transaction_fast(
+    pm: str,
+    cat: str,
+    bc: str,
+    st: str,
+    qty: int,
+    ts: int | None = None,
+) -> dict[str, object]:
+    """Build a clean transaction from pre-drawn categorical values.
+
+    Equivalent to ``_build_transaction()`` with no overrides, except that the
+    payment method, category, country, status, and quantity are supplied by
+    the caller (see ``generate_clean_transactions``).
+
+    Args:
+        pm: Payment method.
+        cat: Product category.
+        bc: Billing (and shipping) country.
+        st: Transaction status.
+        qty: Item quantity.
+        ts: Optional pre-drawn POSIX-seconds timestamp.
+
+    Returns:
+        A dictionary matching the required transaction schema.
+    """
+    if ts is None:
+        ts = _random_timestamp()
+
+    low, high = AMOUNT_RANGES[cat]
+    up_low, up_high = UNIT_PRICE_RANGES[cat]
+
+    return {
+        "transaction_id": _uuid(),
+        "timestamp": _format_timestamp(ts),
+        "customer_email": _random_email(),
+        "customer_ip": _random_ip(),
+        "billing_country": bc,
+        "shipping_country": bc,
+        "card_bin": _random_card_bin(pm),
+        "payment_method": pm,
+        "amount_usd": round(random.uniform(low, high), 2),
+        "status": st,
+        "product_category": cat,
+        "quantity": qty,
+        "unit_price": round(random.uniform(up_low, up_high), 2),
+        "device_fingerprint": _device_fingerprint(),
+        "is_first_purchase": random.random() < 0.30,
+    }
+
+
 # ---------------------------------------------------------------------------
 # Fraud pattern generators
 # ---------------------------------------------------------------------------
 
 
-def generate_velocity_attacks() -> list[dict[str, object]]:
+def generate_velocity_attacks(
+    emails: Iterator[str] | None = None,
+) -> list[dict[str, object]]:
     """Pattern 1: Velocity attacks -- 8 attackers, each with 4-5 rapid transactions.
 
     Each attacker fires 4-5 transactions within a 5-minute window using the
     same email address, simulating automated card testing.
 
+    Args:
+        emails: Identity stream shared with the run's other patterns
+            (default: a fresh ``_email_stream``).
+
     Returns:
         List of transaction dicts (32-40 total).
     """
+    if emails is None:
+        emails = _email_stream()
     transactions: list[dict[str, object]] = []
 
-    for _ in range(8):
-        attacker_email = fake.email()
+    for attacker_email in _pattern_emails(8, emails):
         attacker_ip = _random_ip()
         base_ts = _random_timestamp(hour_start=1, hour_end=22)
         num_txns = random.randint(4, 5)
 
         for j in range(num_txns):
             offset_seconds = random.randint(0, 300)  # within 5 minutes
-            ts = base_ts + timedelta(seconds=offset_seconds)
+            ts = base_ts + offset_seconds
             amount = round(random.uniform(50.0, 500.0), 2)
-            category = random.choices(PRODUCT_CATEGORIES, weights=PRODUCT_WEIGHTS, k=1)[0]
+            category = random.choices(PRODUCT_CATEGORIES, cum_weights=PRODUCT_CUM, k=1)[0]
             up_low, up_high = UNIT_PRICE_RANGES[category]
 
             tx = _build_transaction(
@@ -259,24 +453,32 @@ def generate_velocity_attacks() -> list[dict[str, object]]:
     return transactions
 
 
-def generate_high_value_first_purchases() -> list[dict[str, object]]:
+def generate_high_value_first_purchases(
+    emails: Iterator[str] | None = None,
+) -> list[dict[str, object]]:
     """Pattern 2: High-value first purchases above the $1000 threshold.
 
     Creates 12 unique first-time buyers making large purchases of laptops
     or smartphones -- a common fraud vector.
 
+    Args:
+        emails: Identity stream shared with the run's other patterns
+            (default: a fresh ``_email_stream``).
+
     Returns:
         List of 12 transaction dicts.
     """
+    if emails is None:
+        emails = _email_stream()
     transactions: list[dict[str, object]] = []
 
-    for _ in range(12):
-        category = random.choice(["LAPTOP", "SMARTPHONE"])
+    for email in _pattern_emails(12, emails):
+        category = "LAPTOP" if random.random() < 0.5 else "SMARTPHONE"
         amount = round(random.uniform(1100.0, 2400.0), 2)
         up_low, up_high = UNIT_PRICE_RANGES[category]
 
         tx = _build_transaction(
-            email=fake.email(),
+            email=email,
             billing_country="ID",
             shipping_country="ID",
             amount_usd=amount,
@@ -291,19 +493,26 @@ def generate_high_value_first_purchases() -> list[dict[str, object]]:
     return transactions
 
 
-def generate_decline_sequences() -> list[dict[str, object]]:
+def generate_decline_sequences(
+    emails: Iterator[str] | None = None,
+) -> list[dict[str, object]]:
     """Pattern 3: Multiple declines followed by a successful approval.
 
     Simulates 8 'test-and-hit' attackers who probe with declined transactions
     before getting one approved -- a signature of stolen card testing.
 
+    Args:
+        emails: Identity stream shared with the run's other patterns
+            (default: a fresh ``_email_stream``).
+
     Returns:
         List of transaction dicts (~32 total: 3 declines + 1 approval per attacker).
     """
+    if emails is None:
+        emails = _email_stream()
     transactions: list[dict[str, object]] = []
 
-    for _ in range(8):
-        email = fake.email()
+    for email in _pattern_emails(8, emails):
         ip = _random_ip()
         base_ts = _random_timestamp(hour_start=1, hour_end=22)
         category = random.choice(["LAPTOP", "SMARTPHONE", "CAMERA"])
@@ -312,8 +521,8 @@ def generate_decline_sequences() -> list[dict[str, object]]:
         # 3 declined transactions within 30 minutes
         for j in range(3):
             offset_minutes = random.randint(0, 30)
-            ts = base_ts + timedelta(minutes=offset_minutes)
-            decline_status = random.choice(["HARD_DECLINED", "SOFT_DECLINED"])
+            ts = base_ts + offset_minutes * 60
+            decline_status = "HARD_DECLINED" if random.random() < 0.5 else "SOFT_DECLINED"
 
             tx = _build_transaction(
                 timestamp=ts,
@@ -332,7 +541,7 @@ def generate_decline_sequences() -> list[dict[str, object]]:
 
         # 1 final approved transaction within 1 hour of start
         final_offset = random.randint(35, 60)
-        final_ts = base_ts + timedelta(minutes=final_offset)
+        final_ts = base_ts + final_offset * 60
         tx = _build_transaction(
             timestamp=final_ts,
             email=email,
@@ -351,26 +560,34 @@ def generate_decline_sequences() -> list[dict[str, object]]:
     return transactions
 
 
-def generate_geo_mismatches() -> list[dict[str, object]]:
+def generate_geo_mismatches(
+    emails: Iterator[str] | None = None,
+) -> list[dict[str, object]]:
     """Pattern 4: Geographic mismatch between billing and shipping countries.
 
     Creates 8 transactions where the billing country is a Southeast Asian
     neighbour but the goods ship to Indonesia.
 
+    Args:
+        emails: Identity stream shared with the run's other patterns
+            (default: a fresh ``_email_stream``).
+
     Returns:
         List of 8 transaction dicts.
     """
+    if emails is None:
+        emails = _email_stream()
     transactions: list[dict[str, object]] = []
     foreign_countries = ["SG", "MY", "TH"]
 
-    for _ in range(8):
+    for email in _pattern_emails(8, emails):
         billing = random.choice(foreign_countries)
-        status = random.choices(["APPROVED", "SOFT_DECLINED"], weights=[0.7, 0.3], k=1)[0]
-        category = random.choices(PRODUCT_CATEGORIES, weights=PRODUCT_WEIGHTS, k=1)[0]
+        status = "APPROVED" if random.random() < 0.7 else "SOFT_DECLINED"
+        category = random.choices(PRODUCT_CATEGORIES, cum_weights=PRODUCT_CUM, k=1)[0]
         up_low, up_high = UNIT_PRICE_RANGES[category]
 
         tx = _build_transaction(
-            email=fake.email(),
+            email=email,
             billing_country=billing,
             shipping_country="ID",
             amount_usd=round(random.uniform(300.0, 1200.0), 2),
@@ -384,37 +601,41 @@ def generate_geo_mismatches() -> list[dict[str, object]]:
     return transactions
 
 
-def generate_bin_patterns() -> list[dict[str, object]]:
+def generate_bin_patterns(
+    emails: Iterator[str] | None = None,
+) -> list[dict[str, object]]:
     """Pattern 5: Suspicious BIN clusters -- same card prefix, many emails.
 
     Defines 6 suspicious BINs, each used by 3-4 different email addresses
     within a 2-hour window.  This mimics mass-produced counterfeit cards
     sharing a BIN range.
 
+    Args:
+        emails: Identity stream shared with the run's other patterns
+            (default: a fresh ``_email_stream``).
+
     Returns:
         List of transaction dicts (18-24 total).
     """
+    if emails is None:
+        emails = _email_stream()
     transactions: list[dict[str, object]] = []
 
     for suspicious_bin in SUSPICIOUS_BINS:
         num_users = random.randint(3, 4)
         base_ts = _random_timestamp(hour_start=1, hour_end=21)
 
-        for _ in range(num_users):
+        for email in _pattern_emails(num_users, emails):
             offset_minutes = random.randint(0, 120)
-            ts = base_ts + timedelta(minutes=offset_minutes)
-            category = random.choices(PRODUCT_CATEGORIES, weights=PRODUCT_WEIGHTS, k=1)[0]
+            ts = base_ts + offset_minutes * 60
+            category = random.choices(PRODUCT_CATEGORIES, cum_weights=PRODUCT_CUM, k=1)[0]
             up_low, up_high = UNIT_PRICE_RANGES[category]
 
-            status = random.choices(
-                ["APPROVED", "SOFT_DECLINED"],
-                weights=[0.8, 0.2],
-                k=1,
-            )[0]
+            status = "APPROVED" if random.random() < 0.8 else "SOFT_DECLINED"
 
             tx = _build_transaction(
                 timestamp=ts,
-                email=fake.email(),
+                email=email,
                 payment_method="CREDIT_CARD",
                 card_bin=suspicious_bin,
                 amount_usd=round(random.uniform(200.0, 800.0), 2),
@@ -433,22 +654,171 @@ def generate_bin_patterns() -> list[dict[str, object]]:
 # ---------------------------------------------------------------------------
 
 
-def generate_clean_transactions(count: int) -> list[dict[str, object]]:
+def generate_clean_transactions(
+    count: int,
+    rng: np.random.Generator | None = None,
+) -> list[dict[str, object]]:
     """Generate legitimate-looking transactions with natural distribution.
 
     Args:
         count: Number of clean transactions to produce.
+        rng: Optional NumPy generator.  When given, the rows are drawn in
+            bulk by ``_generate_clean_vectorized`` instead of one at a time.
 
     Returns:
         List of *count* transaction dicts.
     """
-    transactions: list[dict[str, object]] = []
+    if rng is not None:
+        return _generate_clean_vectorized(count, rng)
 
-    for _ in range(count):
-        tx = _build_transaction()
-        transactions.append(tx)
+    # Pre-draw every categorical attribute in one ``random.choices`` call each
+    # instead of paying the per-call setup cost for ``count`` single draws.
+    pms = random.choices(PAYMENT_METHODS, cum_weights=PAYMENT_CUM, k=count)
+    cats = random.choices(PRODUCT_CATEGORIES, cum_weights=PRODUCT_CUM, k=count)
+    bcs = random.choices(COUNTRIES, cum_weights=COUNTRY_CUM, k=count)
+    sts = random.choices(STATUSES, cum_weights=STATUS_CUM, k=count)
+    qtys = random.choices(QUANTITIES, cum_weights=QTY_CUM, k=count)
 
-    return transactions
+    return [
+        _build_transaction_fast(pm, cat, bc, st, qty)
+        for pm, cat, bc, st, qty in zip(pms, cats, bcs, sts, qtys)
+    ]
+
+
+def _generate_clean_chunk(args: tuple[int, int]) -> list[dict[str, object]]:
+    """Process-pool worker: reseed the RNGs and generate one clean chunk.
+
+    Args:
+        args: ``(count, seed)`` pair for this chunk.
+
+    Returns:
+        List of *count* transaction dicts.
+    """
+    count, seed = args
+    random.seed(seed)
+    Faker.seed(seed)
+    return generate_clean_transactions(count)
+
+
+def _generate_clean_parallel(
+    count: int,
+    workers: int | None = None,
+) -> list[dict[str, object]]:
+    """Generate clean transactions in chunks across worker processes.
+
+    Each chunk is seeded from the parent's ``random`` state, so a seeded
+    run stays reproducible for a given worker count.
+
+    Args:
+        count: Number of clean transactions to produce.
+        workers: Number of worker processes (default: CPU count).
+
+    Returns:
+        List of *count* transaction dicts.
+    """
+    workers = workers or os.cpu_count() or 1
+    seeds = [random.getrandbits(32) for _ in range(workers)]
+    sizes = [count // workers + (1 if i < count % workers else 0) for i in range(workers)]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunks = executor.map(_generate_clean_chunk, zip(sizes, seeds))
+        return [tx for chunk in chunks for tx in chunk]
+
+
+def _generate_clean_vectorized(
+    count: int,
+    rng: np.random.Generator,
+) -> list[dict[str, object]]:
+    """Generate clean transactions with bulk NumPy sampling.
+
+    Every categorical, uniform, and timestamp column is drawn for all *count*
+    rows in a single call, then the columns are zipped into dicts.  The
+    distributions match ``_build_transaction_fast``, including the two-peak
+    hour profile of ``_random_timestamp``.
+
+    Args:
+        count: Number of clean transactions to produce.
+        rng: NumPy random generator driving every draw.
+
+    Returns:
+        List of *count* transaction dicts.
+    """
+    if count <= 0:
+        return []
+
+    cat_idx = rng.choice(len(CATEGORY_IDS), size=count, p=PRODUCT_WEIGHTS)
+    amounts = np.round(rng.uniform(AMOUNT_LOW[cat_idx], AMOUNT_HIGH[cat_idx]), 2)
+    unit_prices = np.round(rng.uniform(UP_LOW[cat_idx], UP_HIGH[cat_idx]), 2)
+    categories = [PRODUCT_CATEGORIES[i] for i in cat_idx.tolist()]
+    pm_arr = rng.choice(PAYMENT_METHODS, size=count, p=PAYMENT_WEIGHTS)
+    pms = pm_arr.tolist()
+    is_card = pm_arr == "CREDIT_CARD"
+    card_bins = np.full(count, None, dtype=object)
+    card_bins[is_card] = rng.choice(ALL_CARD_BINS, size=int(is_card.sum()))
+    bcs = rng.choice(COUNTRIES, size=count, p=COUNTRY_WEIGHTS).tolist()
+    sts = rng.choice(STATUSES, size=count, p=STATUS_WEIGHTS).tolist()
+    qtys = rng.choice(QUANTITIES, size=count, p=QUANTITY_WEIGHTS).tolist()
+
+    # Two-peak hour profile: pick a peak window or the full day per row.
+    peak_idx = rng.integers(0, len(PEAK_HOUR_RANGES), size=count)
+    peak_start = np.array([r[0] for r in PEAK_HOUR_RANGES])[peak_idx]
+    peak_end = np.array([r[1] for r in PEAK_HOUR_RANGES])[peak_idx]
+    hours = np.where(
+        rng.random(count) < PEAK_PROBABILITY,
+        rng.integers(peak_start, peak_end),
+        rng.integers(0, 24, size=count),
+    )
+    minutes = rng.integers(0, 60, size=count).tolist()
+    secs = rng.integers(0, 60, size=count).tolist()
+    # All rows fall on BASE_DATE, so the ISO string is assembled from
+    # precomputed two-digit components instead of formatting a datetime.
+    timestamps = [
+        f"{BASE_DATE_PREFIX}T{TWO_DIGITS[h]}:{TWO_DIGITS[m]}:{TWO_DIGITS[sec]}"
+        for h, m, sec in zip(hours.tolist(), minutes, secs)
+    ]
+
+    first_purchases = (rng.random(count) < 0.30).tolist()
+
+    user_ids = rng.integers(0, 10**9, size=count).tolist()
+    domains = rng.choice(EMAIL_DOMAINS, size=count).tolist()
+    emails = [f"user{uid}@{dom}" for uid, dom in zip(user_ids, domains)]
+    octets = rng.integers(0, 256, size=(count, 3)).tolist()
+    first_octets = rng.choice(PUBLIC_FIRST_OCTETS, size=count).tolist()
+    ips = [f"{a}.{b}.{c}.{d}" for a, (b, c, d) in zip(first_octets, octets)]
+
+    # One urandom read each for all transaction ids and device fingerprints.
+    id_hex = os.urandom(16 * count).hex()
+    tx_ids = [_format_uuid4(id_hex[i : i + 32]) for i in range(0, 32 * count, 32)]
+    fp_hex = os.urandom(8 * count).hex()
+    no_device = (rng.random(count) < 0.15).tolist()
+    devices = [
+        None if missing else fp_hex[i * 16 : (i + 1) * 16]
+        for i, missing in enumerate(no_device)
+    ]
+
+    return [
+        {
+            "transaction_id": tx_id,
+            "timestamp": ts,
+            "customer_email": email,
+            "customer_ip": ip,
+            "billing_country": bc,
+            "shipping_country": bc,
+            "card_bin": cb,
+            "payment_method": pm,
+            "amount_usd": amt,
+            "status": st,
+            "product_category": cat,
+            "quantity": qty,
+            "unit_price": up,
+            "device_fingerprint": dfp,
+            "is_first_purchase": fp,
+        }
+        for tx_id, ts, email, ip, pm, cb, cat, bc, st, qty, amt, up, dfp, fp in zip(
+            tx_ids, timestamps, emails, ips, pms, card_bins.tolist(), categories, bcs, sts, qtys,
+            amounts.tolist(), unit_prices.tolist(), devices, first_purchases,
+        )
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -456,7 +826,10 @@ def generate_clean_transactions(count: int) -> list[dict[str, object]]:
 # ---------------------------------------------------------------------------
 
 
-def generate_dataset(total: int = 550) -> list[dict[str, object]]:
+def generate_dataset(
+    total: int = 550,
+    rng: np.random.Generator | None = None,
+) -> list[dict[str, object]]:
     """Assemble the full synthetic dataset with embedded fraud patterns.
 
     Generates fraud patterns first (they require specific timing constraints),
@@ -465,71 +838,139 @@ def generate_dataset(total: int = 550) -> list[dict[str, object]]:
 
     Args:
         total: Minimum total number of transactions to produce.
+        rng: Optional NumPy generator used for the vectorized clean path.
 
     Returns:
         A list of at least *total* transaction dicts sorted by timestamp.
     """
-    transactions: list[dict[str, object]] = []
-
-    # 1. Generate fraud patterns first (they need specific timing)
-    velocity = generate_velocity_attacks()
-    high_value = generate_high_value_first_purchases()
-    declines = generate_decline_sequences()
-    geo = generate_geo_mismatches()
-    bins = generate_bin_patterns()
+    # 1. Generate fraud patterns first (they need specific timing), drawing
+    #    every identity from one stream so no two patterns share a customer
+    emails = _email_stream()
+    velocity = generate_velocity_attacks(emails)
+    high_value = generate_high_value_first_purchases(emails)
+    declines = generate_decline_sequences(emails)
+    geo = generate_geo_mismatches(emails)
+    bins = generate_bin_patterns(emails)
 
-    transactions.extend(velocity)
-    transactions.extend(high_value)
-    transactions.extend(declines)
-    transactions.extend(geo)
-    transactions.extend(bins)
-
-    fraud_count = len(transactions)
+    fraud_count = len(velocity) + len(high_value) + len(declines) + len(geo) + len(bins)
 
     # 2. Fill remainder with clean transactions
     clean_needed = max(0, total - fraud_count)
-    clean = generate_clean_transactions(clean_needed)
-    transactions.extend(clean)
+    if rng is None and clean_needed >= PARALLEL_THRESHOLD:
+        clean = _generate_clean_parallel(clean_needed)
+    else:
+        clean = generate_clean_transactions(clean_needed, rng=rng)
 
-    # 3. Sort by timestamp
-    transactions.sort(key=lambda x: str(x["timestamp"]))
+    # Materialise every part in one C-level list construction.
+    transactions = list(itertools.chain(velocity, high_value, declines, geo, bins, clean))
+
+    # 3. Sort by timestamp (fixed-width ISO strings sort chronologically)
+    transactions.sort(key=itemgetter("timestamp"))
 
     return transactions
 
 
-def _print_summary(transactions: list[dict[str, object]]) -> None:
-    """Print a summary of the generated dataset to stdout.
+def _iter_clean_sorted(count: int) -> Iterator[dict[str, object]]:
+    """Yield *count* clean transactions in timestamp order.
+
+    All *count* integer timestamps are drawn and sorted up front (one
+    ``int`` each, so memory is O(*count*)); the row dicts themselves are
+    built ``STREAM_CHUNK_SIZE`` at a time as they are consumed.
 
     Args:
-        transactions: The full list of generated transactions.
+        count: Number of clean transactions to produce.
+
+    Yields:
+        Transaction dicts with non-decreasing timestamps.
     """
-    total = len(transactions)
-    statuses = {}
-    methods = {}
-    categories = {}
-    countries = {}
-    first_purchase_count = 0
+    timestamps = sorted(_random_timestamp() for _ in range(count))
+    for start in range(0, count, STREAM_CHUNK_SIZE):
+        chunk = timestamps[start : start + STREAM_CHUNK_SIZE]
+        k = len(chunk)
+        pms = random.choices(PAYMENT_METHODS, cum_weights=PAYMENT_CUM, k=k)
+        cats = random.choices(PRODUCT_CATEGORIES, cum_weights=PRODUCT_CUM, k=k)
+        bcs = random.choices(COUNTRIES, cum_weights=COUNTRY_CUM, k=k)
+        sts = random.choices(STATUSES, cum_weights=STATUS_CUM, k=k)
+        qtys = random.choices(QUANTITIES, cum_weights=QTY_CUM, k=k)
+        for pm, cat, bc, st, qty, ts in zip(pms, cats, bcs, sts, qtys, chunk):
+            yield _build_transaction_fast(pm, cat, bc, st, qty, ts)
+
+
+def iter_dataset(total: int = 550) -> Iterator[dict[str, object]]:
+    """Stream the synthetic dataset in timestamp order.
+
+    Streaming counterpart of ``generate_dataset`` for large runs: the few
+    hundred fraud-pattern rows are materialised and sorted, then merged with
+    clean rows that are generated lazily.  Only the clean rows' sorted
+    integer timestamps are held for the whole run, so memory still grows
+    with *total* but the transaction dicts are kept to one chunk at a time.
+
+    Args:
+        total: Minimum total number of transactions to produce.
+
+    Yields:
+        At least *total* transaction dicts sorted by timestamp.
+    """
+    emails = _email_stream()
+    fraud = list(itertools.chain(
+        generate_velocity_attacks(emails),
+        generate_high_value_first_purchases(emails),
+        generate_decline_sequences(emails),
+        generate_geo_mismatches(emails),
+        generate_bin_patterns(emails),
+    ))
+    fraud.sort(key=itemgetter("timestamp"))
+
+    clean = _iter_clean_sorted(max(0, total - len(fraud)))
+    yield from heapq.merge(fraud, clean, key=itemgetter("timestamp"))
 
-    for tx in transactions:
-        st = str(tx["status"])
-        statuses[st] = statuses.get(st, 0) + 1
 
-        pm = str(tx["payment_method"])
-        methods[pm] = methods.get(pm, 0) + 1
+def _write_dataset(dataset: list[dict[str, object]], output_path: Path) -> None:
+    """Serialize the dataset to *output_path* as a JSON array.
 
-        cat = str(tx["product_category"])
-        categories[cat] = categories.get(cat, 0) + 1
+    Uses ``orjson`` (indented, written as bytes) when it is installed.
+    Otherwise each record is encoded and written on its own with the stdlib
+    encoder, one per line: ``indent`` would push ``json`` onto its pure-Python
+    path, while per-record ``json.dumps`` stays on the C encoder, remains
+    readable and never builds the whole array as one string.
 
-        bc = str(tx["billing_country"])
-        countries[bc] = countries.get(bc, 0) + 1
+    Args:
+        dataset: Transactions to write.
+        output_path: Destination file path.
+    """
+    if orjson is not None:
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(dataset, option=orjson.OPT_INDENT_2))
+        return
 
-        if tx["is_first_purchase"]:
-            first_purchase_count += 1
+    with open(output_path, "w", encoding="utf-8") as f:
+        separator = "[\n"
+        for tx in dataset:
+            f.write(separator)
+            f.write(json.dumps(tx, separators=(",", ":"), default=str))
+            separator = ",\n"
+        f.write("\n]\n" if dataset else "[]\n")
+
+
+def _print_summary(transactions: list[dict[str, object]]) -> None:
+    """Print a summary of the generated dataset to stdout.
 
-    amounts = [float(tx["amount_usd"]) for tx in transactions]
-    avg_amount = sum(amounts) / len(amounts) if amounts else 0.0
-    min_amount = min(amounts) if amounts else 0.0
-    max_amount = max(amounts) if amounts else 0.0
+    Args:
+        transactions: The full list of generated transactions.
+    """
+    total = len(transactions)
+    statuses = Counter(str(tx["status"]) for tx in transactions)
+    methods = Counter(str(tx["payment_method"]) for tx in transactions)
+    categories = Counter(str(tx["product_category"]) for tx in transactions)
+    countries = Counter(str(tx["billing_country"]) for tx in transactions)
+    first_purchase_count = sum(1 for tx in transactions if tx["is_first_purchase"])
+
+    amounts = np.fromiter(
+        (tx["amount_usd"] for tx in transactions), dtype=np.float64, count=total,
+    )
+    avg_amount = float(amounts.mean()) if total else 0.0
+    min_amount = float(amounts.min()) if total else 0.0
+    max_amount = float(amounts.max()) if total else 0.0
 
     geo_mismatch_count = sum(
         1 for tx in transactions if tx["billing_country"] != tx["shipping_country"]
@@ -592,19 +1033,23 @@ if __name__ == "__main__":
         "--output", type=str, default=None,
         help="Output file path (default: data/transactions.json)",
     )
+    parser.add_argument(
+        "--fast", action="store_true",
+        help="Draw clean transactions in bulk with a seeded NumPy generator",
+    )
     args = parser.parse_args()
 
     random.seed(args.seed)
     Faker.seed(args.seed)
 
     print(f"Generating {args.count} transactions (seed={args.seed})...")
-    dataset = generate_dataset(total=args.count)
+    rng = np.random.default_rng(args.seed) if args.fast else None
+    dataset = generate_dataset(total=args.count, rng=rng)
 
     script_dir = Path(__file__).resolve().parent
     output_path = Path(args.output) if args.output else script_dir / "transactions.json"
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(dataset, f, indent=2, default=str)
+    _write_dataset(dataset, output_path)
 
     print(f"Generated {len(dataset)} transactions -> {output_path}")
     _print_summary(dataset)
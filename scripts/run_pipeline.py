@@ -6,7 +6,7 @@ JSON file, and processes them through the fraud detection pipeline.
 
 Usage::
 
-    python scripts/run_pipeline.py [--data-file data/transactions.json] [--delay 0.01]
+    python scripts/run_pipeline.py [--data-file data/transactions.json] [--delay 0.01] [--batch-size 1]
 """
 
 from __future__ import annotations
@@ -14,6 +14,7 @@ from __future__ import annotations
 import argparse
 import asyncio
 import logging
+import logging.handlers
 import os
 import sys
 
@@ -26,19 +27,39 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.models.database import create_tables  # noqa: E402
 from src.pipeline.ingestion import FraudDetectionPipeline  # noqa: E402
 
+# Log records buffered before writing to the console in one go.
+LOG_BUFFER_CAPACITY = 1000
 
-def _configure_logging() -> None:
-    """Set up root logger with a clean console format."""
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
+
+def _configure_logging() -> logging.handlers.MemoryHandler:
+    """Set up root logger with a clean console format.
+
+    The pipeline logs one line per transaction, so console output goes
+    through a ``MemoryHandler`` that writes records in bulk instead of
+    taking the stream lock on every row.  Errors are flushed immediately.
+
+    Returns:
+        The buffering handler, so callers can flush it before printing.
+    """
+    console = logging.StreamHandler()
+    console.setFormatter(
+        logging.Formatter(
+            "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
+    )
+    buffered = logging.handlers.MemoryHandler(
+        capacity=LOG_BUFFER_CAPACITY,
+        flushLevel=logging.ERROR,
+        target=console,
     )
+    logging.basicConfig(level=logging.INFO, handlers=[buffered])
+    return buffered
 
 
 async def main() -> None:
     """Parse arguments, initialise the database, and run the pipeline."""
-    _configure_logging()
+    log_buffer = _configure_logging()
 
     parser = argparse.ArgumentParser(
         description="Run the SkyMart fraud detection pipeline",
@@ -46,7 +67,10 @@ async def main() -> None:
     parser.add_argument(
         "--data-file",
         default="data/transactions.json",
-        help="Path to the transactions JSON file (default: data/transactions.json)",
+        help=(
+            "Path to the transactions JSON array or .ndjson/.jsonl file "
+            "(default: data/transactions.json)"
+        ),
     )
     parser.add_argument(
         "--delay",
@@ -54,6 +78,12 @@ async def main() -> None:
         default=0.01,
         help="Delay in seconds between transactions to simulate real-time (default: 0.01)",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1,
+        help="Transactions committed together and per delay interval (default: 1)",
+    )
     args = parser.parse_args()
 
     print("=== SkyMart Fraud Detection Pipeline ===")
@@ -62,7 +92,13 @@ async def main() -> None:
 
     print(f"Loading transactions from {args.data_file}...")
     pipeline = FraudDetectionPipeline()
-    summary = await pipeline.ingest_from_json(args.data_file, delay_seconds=args.delay)
+    summary = await pipeline.ingest_from_json(
+        args.data_file,
+        delay_seconds=args.delay,
+        batch_size=args.batch_size,
+    )
+
+    log_buffer.flush()
 
     total: int = summary["total"]
     flagged: int = summary["flagged"]
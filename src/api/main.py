@@ -8,6 +8,7 @@ from pathlib import Path
 
 from fastapi import BackgroundTasks, FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
@@ -15,24 +16,36 @@ from src.api.routes.alerts import alerts_router
 from src.api.routes.metrics import metrics_router
 from src.api.routes.transactions import transactions_router
 from src.api.websocket import manager
+from src.config import get_settings
 from src.models.database import create_tables
 from src.pipeline.ingestion import FraudDetectionPipeline
+from src.pipeline.rules_engine import rule_stats
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson  # noqa: F401  (ORJSONResponse needs it at render time)
+except ImportError:  # pragma: no cover - orjson is an optional speed-up
+    _DefaultResponse: type[JSONResponse] = JSONResponse
+else:
+    _DefaultResponse = ORJSONResponse
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Application lifespan handler for startup and shutdown tasks.
 
-    Creates database tables on startup and logs readiness.
+    Creates database tables and starts the optional Redis alert relay on
+    startup; stops the relay on shutdown.
 
     Args:
         app: The FastAPI application instance.
     """
     await create_tables()
+    await manager.start_pubsub()
     logger.info("SkyMart Fraud Detection API started. Database tables ready.")
     yield
+    await manager.stop_pubsub()
 
 
 app = FastAPI(
@@ -40,6 +53,7 @@ app = FastAPI(
     description="Real-time fraud detection dashboard API with WebSocket alerts",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=_DefaultResponse,
 )
 
 # CORS middleware for local development
@@ -70,11 +84,11 @@ async def websocket_alerts(websocket: WebSocket) -> None:
     Args:
         websocket: The incoming WebSocket connection.
     """
-    await manager.connect(websocket)
+    await manager.connect(
+        websocket,
+        greeting={"type": "connected", "message": "Connected to fraud alert stream"},
+    )
     try:
-        await websocket.send_json(
-            {"type": "connected", "message": "Connected to fraud alert stream"}
-        )
         while True:
             await websocket.receive_text()
     except WebSocketDisconnect:
@@ -84,6 +98,10 @@ async def websocket_alerts(websocket: WebSocket) -> None:
 # ---------------------------------------------------------------------------
 # Pipeline trigger endpoint (inline, not in a separate router)
 # ---------------------------------------------------------------------------
+# Generated transactions committed per database transaction.
+GENERATE_BATCH_SIZE = 100
+
+
 class GenerateRequest(BaseModel):
     """Request body for the generate-and-ingest endpoint."""
     count: int = 500
@@ -101,14 +119,19 @@ class GenerateResponse(BaseModel):
 async def _run_generate_pipeline(count: int, seed: int) -> None:
     """Background task: generate synthetic transactions then ingest them."""
     try:
+        # Imported here: the generator pulls in NumPy and Faker, which would
+        # otherwise weigh on every cold start.  The task runs once per job
+        # and later imports are sys.modules lookups, so keeping them local
+        # costs nothing.
         import random
         from faker import Faker
-        from data.generate_data import generate_dataset
+        from data.generate_data import iter_dataset
         random.seed(seed)
         Faker.seed(seed)
-        transactions = generate_dataset(total=count)
         pipeline = FraudDetectionPipeline(broadcast_callback=manager.broadcast)
-        summary = await pipeline.ingest_from_list(transactions)
+        summary = await pipeline.ingest_from_iter(
+            iter_dataset(total=count), batch_size=GENERATE_BATCH_SIZE,
+        )
         logger.info(
             "Generate pipeline done: total=%s flagged=%s",
             summary.get("total"), summary.get("flagged"),
@@ -206,6 +229,27 @@ async def trigger_pipeline(
     return PipelineTriggerResponse(status="started", message="Pipeline triggered")
 
 
+# ---------------------------------------------------------------------------
+# Rule profiling (PROFILE_RULES)
+# ---------------------------------------------------------------------------
+# Registered only when profiling is on, so production builds do not expose
+# internal timing data.
+if get_settings().PROFILE_RULES:
+
+    @app.get("/internal/rule_stats", tags=["internal"])
+    async def get_rule_stats() -> dict[str, object]:
+        """Return the per-rule profile counters of this worker process.
+
+        Counters cover pipelines run inside this process (e.g.
+        ``/api/pipeline/*``).
+
+        Returns:
+            ``{"enabled": True, "rules": {name: {calls, triggers, total_ns,
+            mean_ns}}}``.
+        """
+        return {"enabled": True, "rules": rule_stats()}
+
+
 # ---------------------------------------------------------------------------
 # Mount static files for dashboard (must be last to avoid route conflicts)
 # Use absolute path so it works both locally and on Vercel.
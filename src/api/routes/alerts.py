@@ -3,14 +3,20 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timedelta, timezone
+from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import TypeAdapter
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
-from src.models.database import FraudAlert, Transaction, get_db
-from src.schemas.schemas import AlertStatusUpdate, FraudAlertResponse
+from src.models.database import FraudAlert, Transaction, get_db, get_read_db
+from src.schemas.schemas import (
+    AlertStatusUpdate,
+    FraudAlertResponse,
+    TransactionResponse,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -23,13 +29,35 @@ VALID_STATUSES: set[str] = {
     "CONFIRMED_FRAUD",
 }
 
+# Columns projected by the list endpoint: the alert fields followed by the
+# nested transaction fields, in ``FraudAlertResponse`` order.
+_ALERT_FIELDS: tuple[str, ...] = (
+    "alert_id",
+    "transaction_id",
+    "risk_score",
+    "triggered_rules",
+    "alert_status",
+    "created_at",
+    "updated_at",
+)
+_TRANSACTION_FIELDS: tuple[str, ...] = tuple(TransactionResponse.model_fields)
+_LIST_COLUMNS = (
+    *(getattr(FraudAlert, name) for name in _ALERT_FIELDS),
+    *(getattr(Transaction, name) for name in _TRANSACTION_FIELDS),
+)
+
+# Validates a whole page of alerts in one pydantic-core call.
+_ALERTS_ADAPTER: TypeAdapter[list[FraudAlertResponse]] = TypeAdapter(
+    list[FraudAlertResponse],
+)
+
 
 @alerts_router.get("", response_model=list[FraudAlertResponse])
 async def get_alerts(
     status: str | None = Query(default=None, description="Filter by alert status"),
     min_risk: int = Query(default=0, ge=0, le=100, description="Minimum risk score"),
     hours: int = Query(default=24, ge=1, description="Lookback window in hours"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> list[FraudAlertResponse]:
     """Retrieve fraud alerts with optional filtering.
 
@@ -44,9 +72,11 @@ async def get_alerts(
     """
     cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
 
+    # Project plain columns over a single JOIN rather than hydrating ORM
+    # objects and issuing a second SELECT for the transactions.
     stmt = (
-        select(FraudAlert)
-        .options(selectinload(FraudAlert.transaction))
+        select(*_LIST_COLUMNS)
+        .join(Transaction, Transaction.transaction_id == FraudAlert.transaction_id)
         .where(FraudAlert.risk_score >= min_risk)
         .where(FraudAlert.created_at >= cutoff)
     )
@@ -62,15 +92,20 @@ async def get_alerts(
     stmt = stmt.order_by(FraudAlert.created_at.desc()).limit(200)
 
     result = await db.execute(stmt)
-    alerts = result.scalars().all()
 
-    return [FraudAlertResponse.model_validate(alert) for alert in alerts]
+    split = len(_ALERT_FIELDS)
+    rows: list[dict[str, Any]] = []
+    for row in result.all():
+        data = dict(zip(_ALERT_FIELDS, row[:split]))
+        data["transaction"] = dict(zip(_TRANSACTION_FIELDS, row[split:]))
+        rows.append(data)
+    return _ALERTS_ADAPTER.validate_python(rows)
 
 
 @alerts_router.get("/{alert_id}", response_model=FraudAlertResponse)
 async def get_alert(
     alert_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> FraudAlertResponse:
     """Retrieve a single fraud alert by its ID.
 
@@ -86,7 +121,7 @@ async def get_alert(
     """
     stmt = (
         select(FraudAlert)
-        .options(selectinload(FraudAlert.transaction))
+        .options(joinedload(FraudAlert.transaction))
         .where(FraudAlert.alert_id == alert_id)
     )
 
@@ -126,7 +161,7 @@ async def update_alert_status(
 
     stmt = (
         select(FraudAlert)
-        .options(selectinload(FraudAlert.transaction))
+        .options(joinedload(FraudAlert.transaction))
         .where(FraudAlert.alert_id == alert_id)
     )
 
@@ -139,7 +174,8 @@ async def update_alert_status(
     alert.alert_status = body.alert_status
     alert.updated_at = datetime.now(timezone.utc)
 
+    # The session factory uses expire_on_commit=False and the transaction was
+    # joined-loaded above, so the instance is still complete after commit.
     await db.commit()
-    await db.refresh(alert, attribute_names=["transaction"])
 
     return FraudAlertResponse.model_validate(alert)
@@ -1,198 +1,250 @@
 """Metrics aggregation endpoints for the fraud detection dashboard."""
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
-from collections import Counter
+import time
 from datetime import datetime, timedelta, timezone
+from typing import Any
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from src.models.database import FraudAlert, Transaction, get_db
+from src.models.database import AlertRule, FraudAlert, Transaction, get_read_db
 from src.schemas.schemas import MetricsResponse
 
 logger = logging.getLogger(__name__)
 
 metrics_router = APIRouter(prefix="/api/metrics", tags=["metrics"])
 
+# Dashboards poll this endpoint from every open tab; results this fresh are
+# served from memory instead of re-running the aggregation queries.
+METRICS_CACHE_TTL_SECONDS = 5
 
-def _build_risk_buckets(alerts: list[FraudAlert]) -> list[dict[str, int | str]]:
-    """Build risk score distribution across 10-point buckets.
+_metrics_cache: dict[int, tuple[float, MetricsResponse]] = {}
+_metrics_inflight: dict[int, asyncio.Future[MetricsResponse]] = {}
 
-    Args:
-        alerts: List of fraud alert ORM objects.
+RISK_BUCKET_LABELS: list[str] = [
+    "0-9", "10-19", "20-29", "30-39", "40-49",
+    "50-59", "60-69", "70-79", "80-89", "90-100",
+]
 
-    Returns:
-        List of dicts with 'bucket' label and 'count' for each range.
-    """
-    bucket_counts: dict[str, int] = {}
-    bucket_labels = [
-        "0-9", "10-19", "20-29", "30-39", "40-49",
-        "50-59", "60-69", "70-79", "80-89", "90-100",
-    ]
-    for label in bucket_labels:
-        bucket_counts[label] = 0
 
-    for alert in alerts:
-        score = alert.risk_score
-        if score >= 90:
-            bucket_counts["90-100"] += 1
-        else:
-            idx = score // 10
-            bucket_counts[bucket_labels[idx]] += 1
-
-    return [{"bucket": label, "count": bucket_counts[label]} for label in bucket_labels]
-
-
-def _compute_top_rules(alerts: list[FraudAlert], top_n: int = 10) -> list[dict[str, int | str]]:
-    """Unnest triggered_rules JSON arrays and count occurrences.
+def _build_risk_buckets(
+    bucket_counts: dict[int, int],
+) -> list[dict[str, int | str]]:
+    """Build risk score distribution across 10-point buckets.
 
     Args:
-        alerts: List of fraud alert ORM objects.
-        top_n: Number of top rules to return.
+        bucket_counts: Alert count per ``FraudAlert.risk_bucket`` value.
 
     Returns:
-        List of dicts with 'rule' name and 'count', sorted descending.
+        List of dicts with 'bucket' label and 'count' for each range.
     """
-    rule_counter: Counter[str] = Counter()
-    for alert in alerts:
-        rules = alert.triggered_rules
-        if isinstance(rules, str):
-            try:
-                rules = json.loads(rules)
-            except (json.JSONDecodeError, TypeError):
-                continue
-        if isinstance(rules, list):
-            for rule in rules:
-                if isinstance(rule, str):
-                    rule_counter[rule] += 1
-
     return [
-        {"rule": rule, "count": count}
-        for rule, count in rule_counter.most_common(top_n)
+        {"bucket": label, "count": bucket_counts.get(idx, 0)}
+        for idx, label in enumerate(RISK_BUCKET_LABELS)
     ]
 
 
 def _compute_hourly_volume(
-    alerts: list[FraudAlert],
+    hourly_counts: dict[int, int],
     hours: int,
 ) -> list[dict[str, int | str]]:
-    """Group alerts by hour and fill in zeros for empty hours.
+    """Fill in zeros for empty hours across the lookback window.
 
     Args:
-        alerts: List of fraud alert ORM objects.
+        hourly_counts: Alert count per epoch hour (seconds since the epoch
+            divided by 3600), as stored in ``FraudAlert.hour_bucket``.
         hours: Number of hours to cover in the lookback window.
 
     Returns:
         List of dicts with 'hour' (ISO format) and 'count' per hour.
     """
-    now = datetime.now(timezone.utc)
-    hourly_counts: Counter[str] = Counter()
+    current_hour = int(time.time()) // 3600
+    # Oldest hour first, ending with the current hour; only these labels
+    # are ever formatted.
+    return [
+        {
+            "hour": datetime.fromtimestamp(hour * 3600, timezone.utc).strftime(
+                "%Y-%m-%dT%H:00:00Z",
+            ),
+            "count": hourly_counts.get(hour, 0),
+        }
+        for hour in range(current_hour - hours + 1, current_hour + 1)
+    ]
+
 
-    for alert in alerts:
-        ts = alert.created_at
-        if ts.tzinfo is None:
-            ts = ts.replace(tzinfo=timezone.utc)
-        hour_key = ts.strftime("%Y-%m-%dT%H:00:00Z")
-        hourly_counts[hour_key] += 1
+async def _top_entities(
+    db: AsyncSession,
+    column: Any,
+    cutoff: datetime,
+    limit: int = 5,
+) -> list[tuple[str, int]]:
+    """Count alerts per transaction attribute and return the most frequent.
 
-    result: list[dict[str, int | str]] = []
-    # range(hours-1, -1, -1): i=hours-1 is the oldest hour, i=0 is the current hour
-    for i in range(hours - 1, -1, -1):
-        hour_dt = now - timedelta(hours=i)
-        hour_key = hour_dt.strftime("%Y-%m-%dT%H:00:00Z")
-        result.append({"hour": hour_key, "count": hourly_counts.get(hour_key, 0)})
+    Args:
+        db: Async database session.
+        column: ``Transaction`` column to group by.
+        cutoff: Lower bound on ``FraudAlert.created_at``.
+        limit: Number of rows to return.
 
-    return result
+    Returns:
+        ``(value, count)`` pairs sorted by count descending.
+    """
+    count = func.count().label("count")
+    stmt = (
+        select(column, count)
+        .select_from(FraudAlert)
+        .join(Transaction, Transaction.transaction_id == FraudAlert.transaction_id)
+        .where(FraudAlert.created_at >= cutoff, column.is_not(None), column != "")
+        .group_by(column)
+        .order_by(count.desc(), column)
+        .limit(limit)
+    )
+    result = await db.execute(stmt)
+    return [(value, n) for value, n in result.all()]
 
 
 @metrics_router.get("", response_model=MetricsResponse)
 async def get_metrics(
+    response: Response,
     hours: int = Query(default=24, ge=1, description="Lookback window in hours"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> MetricsResponse:
     """Compute aggregated fraud detection metrics.
 
     Provides hourly alert volume, risk score distribution, top triggered rules,
     and top suspicious entities (emails, IPs, card BINs) within the lookback window.
 
+    Results are cached per ``hours`` for ``METRICS_CACHE_TTL_SECONDS``;
+    concurrent requests for the same window while it is being computed all
+    await the one in-flight computation.
+
     Args:
+        response: Outgoing response, used to set ``Cache-Control``.
         hours: Number of hours to look back from now.
         db: Async database session dependency.
 
     Returns:
         Aggregated metrics response covering all fraud dimensions.
     """
-    cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+    response.headers["Cache-Control"] = f"max-age={METRICS_CACHE_TTL_SECONDS}"
+
+    cached = _metrics_cache.get(hours)
+    if cached is not None and time.monotonic() - cached[0] < METRICS_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    inflight = _metrics_inflight.get(hours)
+    if inflight is not None:
+        return await asyncio.shield(inflight)
+
+    future: asyncio.Future[MetricsResponse] = asyncio.get_running_loop().create_future()
+    _metrics_inflight[hours] = future
+    try:
+        metrics = await _compute_metrics(hours, db)
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as exc:
+        future.set_exception(exc)
+        # Mark the exception retrieved so an unawaited future doesn't warn.
+        future.exception()
+        raise
+    else:
+        now = time.monotonic()
+        # ``hours`` is client-supplied: drop expired entries so the cache only
+        # ever holds windows requested within the last TTL.
+        expired = [
+            key for key, (stored_at, _) in _metrics_cache.items()
+            if now - stored_at >= METRICS_CACHE_TTL_SECONDS
+        ]
+        for key in expired:
+            del _metrics_cache[key]
+        _metrics_cache[hours] = (now, metrics)
+        future.set_result(metrics)
+        return metrics
+    finally:
+        _metrics_inflight.pop(hours, None)
+
+
+async def _compute_metrics(hours: int, db: AsyncSession) -> MetricsResponse:
+    """Run the aggregation queries behind ``get_metrics``.
 
-    # Fetch all alerts within the window with their transactions eagerly loaded
-    stmt = (
-        select(FraudAlert)
-        .options(selectinload(FraudAlert.transaction))
-        .where(FraudAlert.created_at >= cutoff)
-        .order_by(FraudAlert.created_at.desc())
-    )
-    result = await db.execute(stmt)
-    alerts: list[FraudAlert] = list(result.scalars().all())
+    Args:
+        hours: Number of hours to look back from now.
+        db: Async database session.
+
+    Returns:
+        Aggregated metrics response covering all fraud dimensions.
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+    in_window = FraudAlert.created_at >= cutoff
 
     # 1. Hourly alert volume
-    hourly_alert_volume = _compute_hourly_volume(alerts, hours)
+    hourly_rows = await db.execute(
+        select(FraudAlert.hour_bucket, func.count())
+        .where(in_window)
+        .group_by(FraudAlert.hour_bucket),
+    )
+    hourly_alert_volume = _compute_hourly_volume(dict(hourly_rows.all()), hours)
 
     # 2. Risk score distribution
-    risk_score_distribution = _build_risk_buckets(alerts)
-
-    # 3. Top triggered rules (Python-side aggregation from JSON arrays)
-    top_triggered_rules = _compute_top_rules(alerts, top_n=10)
+    bucket_rows = await db.execute(
+        select(FraudAlert.risk_bucket, func.count())
+        .where(in_window)
+        .group_by(FraudAlert.risk_bucket),
+    )
+    bucket_counts: dict[int, int] = dict(bucket_rows.all())
+    risk_score_distribution = _build_risk_buckets(bucket_counts)
+
+    # 3. Top triggered rules (pre-split into alert_rules at ingest time)
+    rule_count = func.count().label("count")
+    rule_rows = await db.execute(
+        select(AlertRule.rule_name, rule_count)
+        .join(FraudAlert, FraudAlert.alert_id == AlertRule.alert_id)
+        .where(in_window)
+        .group_by(AlertRule.rule_name)
+        .order_by(rule_count.desc(), AlertRule.rule_name)
+        .limit(10),
+    )
+    top_triggered_rules = [
+        {"rule": rule, "count": count} for rule, count in rule_rows.all()
+    ]
 
     # 4. Top suspicious emails
-    email_counter: Counter[str] = Counter()
-    ip_counter: Counter[str] = Counter()
-    bin_counter: Counter[str] = Counter()
-
-    for alert in alerts:
-        txn = alert.transaction
-        if txn is not None:
-            if txn.customer_email:
-                email_counter[txn.customer_email] += 1
-            if txn.customer_ip:
-                ip_counter[txn.customer_ip] += 1
-            if txn.card_bin:
-                bin_counter[txn.card_bin] += 1
-
     top_suspicious_emails = [
         {"email": email, "count": count}
-        for email, count in email_counter.most_common(5)
+        for email, count in await _top_entities(db, Transaction.customer_email, cutoff)
     ]
 
     # 5. Top suspicious IPs
     top_suspicious_ips = [
         {"ip": ip, "count": count}
-        for ip, count in ip_counter.most_common(5)
+        for ip, count in await _top_entities(db, Transaction.customer_ip, cutoff)
     ]
 
     # 6. Top suspicious BINs
     top_suspicious_bins = [
         {"card_bin": card_bin, "count": count}
-        for card_bin, count in bin_counter.most_common(5)
+        for card_bin, count in await _top_entities(db, Transaction.card_bin, cutoff)
     ]
 
-    # 7. Total alerts in last 24h
-    total_alerts_24h = len(alerts) if hours == 24 else 0
-    if hours != 24:
-        cutoff_24h = datetime.now(timezone.utc) - timedelta(hours=24)
-        count_stmt = (
-            select(func.count())
-            .select_from(FraudAlert)
-            .where(FraudAlert.created_at >= cutoff_24h)
-        )
-        count_result = await db.execute(count_stmt)
-        total_alerts_24h = count_result.scalar() or 0
-
+    # 7. Total alerts in last 24h and
     # 8. High risk alerts: score >= 30 (VELOCITY or HIGH_VALUE_FIRST_PURCHASE tier)
-    high_risk_alerts = sum(1 for a in alerts if a.risk_score >= 30)
+    # Both come from one scan using FILTER-ed counts over the wider window.
+    cutoff_24h = datetime.now(timezone.utc) - timedelta(hours=24)
+    summary_stmt = (
+        select(
+            func.count().filter(FraudAlert.created_at >= cutoff_24h),
+            func.count().filter(in_window, FraudAlert.risk_score >= 30),
+        )
+        .select_from(FraudAlert)
+        .where(FraudAlert.created_at >= min(cutoff, cutoff_24h))
+    )
+    summary_result = await db.execute(summary_stmt)
+    total_alerts_24h, high_risk_alerts = summary_result.one()
 
     return MetricsResponse(
         hourly_alert_volume=hourly_alert_volume,
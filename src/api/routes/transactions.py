@@ -2,23 +2,60 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from pydantic import TypeAdapter
+from sqlalchemy import Subquery, literal, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.models.database import Transaction, get_db
+from src.models.database import Transaction, get_read_db
 from src.schemas.schemas import RelatedTransactionsResponse, TransactionResponse
 
 logger = logging.getLogger(__name__)
 
 transactions_router = APIRouter(prefix="/api/transactions", tags=["transactions"])
 
+RELATED_LIMIT = 20
+
+# Validates a list of ORM rows in one pydantic-core call.
+_TRANSACTIONS_ADAPTER: TypeAdapter[list[TransactionResponse]] = TypeAdapter(
+    list[TransactionResponse],
+)
+
+
+def _related_branch(
+    column: Any,
+    value: str,
+    transaction_id: str,
+    match: str,
+) -> Subquery:
+    """Select the ids of the most recent transactions sharing *value*.
+
+    Args:
+        column: ``Transaction`` column to match on.
+        value: Value taken from the anchor transaction.
+        transaction_id: Anchor transaction ID to exclude from the results.
+        match: Label identifying the dimension in the combined query.
+
+    Returns:
+        A subquery of up to ``RELATED_LIMIT`` ``(transaction_id, match)``
+        rows, newest first.
+    """
+    return (
+        select(Transaction.transaction_id, literal(match).label("match"))
+        .where(column == value)
+        .where(Transaction.transaction_id != transaction_id)
+        .order_by(Transaction.timestamp.desc())
+        .limit(RELATED_LIMIT)
+        .subquery()
+    )
+
 
 @transactions_router.get("/{transaction_id}", response_model=TransactionResponse)
 async def get_transaction(
     transaction_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> TransactionResponse:
     """Retrieve a single transaction by its ID.
 
@@ -51,7 +88,7 @@ async def get_transaction(
 )
 async def get_related_transactions(
     transaction_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> RelatedTransactionsResponse:
     """Find transactions related by email, IP, or card BIN.
 
@@ -79,50 +116,38 @@ async def get_related_transactions(
             detail=f"Transaction '{transaction_id}' not found",
         )
 
-    # Related by customer_email
-    email_stmt = (
-        select(Transaction)
-        .where(Transaction.customer_email == txn.customer_email)
-        .where(Transaction.transaction_id != transaction_id)
-        .order_by(Transaction.timestamp.desc())
-        .limit(20)
-    )
-    email_result = await db.execute(email_stmt)
-    by_email = [
-        TransactionResponse.model_validate(t) for t in email_result.scalars().all()
-    ]
-
-    # Related by customer_ip
-    ip_stmt = (
-        select(Transaction)
-        .where(Transaction.customer_ip == txn.customer_ip)
-        .where(Transaction.transaction_id != transaction_id)
-        .order_by(Transaction.timestamp.desc())
-        .limit(20)
-    )
-    ip_result = await db.execute(ip_stmt)
-    by_ip = [
-        TransactionResponse.model_validate(t) for t in ip_result.scalars().all()
+    # Related by customer_email, customer_ip and card_bin (skipped if None):
+    # one UNION ALL on the request's session, split by dimension in Python,
+    # so the endpoint holds a single pooled connection.
+    branches = [
+        _related_branch(column, value, transaction_id, match)
+        for column, value, match in (
+            (Transaction.customer_email, txn.customer_email, "email"),
+            (Transaction.customer_ip, txn.customer_ip, "ip"),
+            (Transaction.card_bin, txn.card_bin, "bin"),
+        )
+        if value is not None
     ]
-
-    # Related by card_bin (skip if None)
-    by_bin: list[TransactionResponse] = []
-    if txn.card_bin is not None:
-        bin_stmt = (
-            select(Transaction)
-            .where(Transaction.card_bin == txn.card_bin)
-            .where(Transaction.transaction_id != transaction_id)
-            .order_by(Transaction.timestamp.desc())
-            .limit(20)
+    related: dict[str, list[Transaction]] = {"email": [], "ip": [], "bin": []}
+    if branches:
+        matches = union_all(*(select(branch) for branch in branches)).subquery()
+        rows = await db.execute(
+            select(Transaction, matches.c.match)
+            .join(matches, Transaction.transaction_id == matches.c.transaction_id)
+            .order_by(Transaction.timestamp.desc()),
         )
-        bin_result = await db.execute(bin_stmt)
-        by_bin = [
-            TransactionResponse.model_validate(t) for t in bin_result.scalars().all()
-        ]
+        for related_txn, match in rows:
+            related[match].append(related_txn)
 
     return RelatedTransactionsResponse(
         transaction=TransactionResponse.model_validate(txn),
-        related_by_email=by_email,
-        related_by_ip=by_ip,
-        related_by_bin=by_bin,
+        related_by_email=_TRANSACTIONS_ADAPTER.validate_python(
+            related["email"], from_attributes=True,
+        ),
+        related_by_ip=_TRANSACTIONS_ADAPTER.validate_python(
+            related["ip"], from_attributes=True,
+        ),
+        related_by_bin=_TRANSACTIONS_ADAPTER.validate_python(
+            related["bin"], from_attributes=True,
+        ),
     )
@@ -1,59 +1,318 @@
-"""WebSocket connection manager for real-time alert broadcasting."""
+"""WebSocket connection manager for real-time alert broadcasting.
+
+When ``REDIS_URL`` is configured, broadcasts are published to a Redis
+pub/sub channel and every worker process relays that channel to its own
+clients, so alerts reach dashboards regardless of which worker ingested
+them.  Without Redis the fanout stays in-process.
+"""
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+from typing import Any, Final
 
 from fastapi import WebSocket
 
+from src.config import get_settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speed-up
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Maximum number of undelivered frames buffered per client before it is
+# considered too slow and dropped.
+OUTBOUND_QUEUE_SIZE: Final[int] = 256
+
+# Close code sent to a dropped slow client ("Try Again Later"), so the
+# dashboard's reconnect logic steps in instead of it silently going quiet.
+SLOW_CLIENT_CLOSE_CODE: Final[int] = 1013
+
+# Alerts arriving within this window (seconds) are merged into one frame;
+# a full batch is flushed immediately.
+COALESCE_WINDOW_SECONDS: Final[float] = 0.02
+COALESCE_MAX_ITEMS: Final[int] = 100
+
+# Backoff (seconds) between attempts to re-subscribe after the Redis relay
+# connection fails, doubling up to the maximum.
+RELAY_RETRY_INITIAL_SECONDS: Final[float] = 0.5
+RELAY_RETRY_MAX_SECONDS: Final[float] = 30.0
+
+
+def _encode(message: dict[str, Any]) -> str:
+    """Serialize *message* to a compact JSON text frame payload."""
+    if orjson is not None:
+        return orjson.dumps(message).decode()
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+def _decode(payload: bytes | str) -> dict[str, Any]:
+    """Parse a JSON payload received from the pub/sub channel."""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
 
 class ConnectionManager:
     """Manages WebSocket connections for real-time fraud alert streaming.
 
-    Maintains a list of active WebSocket connections and provides methods
+    Maintains a set of active WebSocket connections and provides methods
     to connect, disconnect, and broadcast messages to all connected clients.
+    Each connection gets a bounded outbound queue drained by its own writer
+    task, so a slow client never blocks the broadcaster or its peers.
+    Bursts of broadcasts are coalesced into ``{"type": "batch", "items":
+    [...]}`` frames so each client is woken once per burst.
     """
 
     def __init__(self) -> None:
-        self.active_connections: list[WebSocket] = []
+        self.active_connections: set[WebSocket] = set()
+        self._queues: dict[WebSocket, asyncio.Queue[str]] = {}
+        self._writers: dict[WebSocket, asyncio.Task[None]] = {}
+        # Strong references to in-flight close tasks for dropped clients.
+        self._closing: set[asyncio.Task[None]] = set()
+        self._pending: list[dict[str, Any]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._redis: Any = None
+        self._relay_task: asyncio.Task[None] | None = None
 
-    async def connect(self, websocket: WebSocket) -> None:
+    async def connect(
+        self,
+        websocket: WebSocket,
+        greeting: dict[str, Any] | None = None,
+    ) -> None:
         """Accept and register a new WebSocket connection.
 
         Args:
             websocket: The incoming WebSocket connection to accept.
+            greeting: Optional first message for the client.  It is queued
+                before the writer starts, so the writer stays the socket's
+                only sender.
         """
         await websocket.accept()
-        self.active_connections.append(websocket)
+        queue: asyncio.Queue[str] = asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE)
+        if greeting is not None:
+            queue.put_nowait(_encode(greeting))
+        self.active_connections.add(websocket)
+        self._queues[websocket] = queue
+        self._writers[websocket] = asyncio.create_task(
+            self._writer_loop(websocket, queue),
+        )
         logger.info(f"WebSocket connected. Total: {len(self.active_connections)}")
 
     def disconnect(self, websocket: WebSocket) -> None:
-        """Remove a WebSocket connection from the active list.
+        """Remove a WebSocket connection from the active set.
+
+        Also stops the connection's writer task and drops its queue.
 
         Args:
             websocket: The WebSocket connection to remove.
         """
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
+        self._release(websocket)
         logger.info(f"WebSocket disconnected. Total: {len(self.active_connections)}")
 
+    def _release(self, websocket: WebSocket) -> None:
+        """Drop the queue of *websocket* and cancel its writer task.
+
+        Args:
+            websocket: A connection already removed from the active set.
+        """
+        self._queues.pop(websocket, None)
+        writer = self._writers.pop(websocket, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
+
+    def _schedule_close(self, websocket: WebSocket, code: int) -> None:
+        """Close *websocket* in the background with the given close code.
+
+        Args:
+            websocket: A connection already removed from the active set.
+            code: WebSocket close code sent to the client.
+        """
+        task = asyncio.get_running_loop().create_task(self._close(websocket, code))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _close(websocket: WebSocket, code: int) -> None:
+        """Close *websocket*, ignoring a connection that is already gone.
+
+        Args:
+            websocket: The connection to close.
+            code: WebSocket close code sent to the client.
+        """
+        try:
+            await websocket.close(code=code)
+        except Exception:
+            # The peer may already be gone; nothing left to release.
+            logger.debug("WebSocket already closed while dropping slow client")
+
+    async def start_pubsub(self) -> None:
+        """Connect to Redis and start relaying the alerts channel locally.
+
+        A no-op unless ``REDIS_URL`` is set.  The ``redis`` package is only
+        imported here, so single-process deployments don't need it.
+        """
+        settings = get_settings()
+        if not settings.REDIS_URL or self._redis is not None:
+            return
+        try:
+            import redis.asyncio as aioredis
+        except ImportError:
+            logger.warning("REDIS_URL is set but redis is not installed -- broadcasting in-process")
+            return
+
+        self._redis = aioredis.from_url(settings.REDIS_URL)
+        self._relay_task = asyncio.create_task(
+            self._relay_loop(settings.REDIS_ALERTS_CHANNEL),
+        )
+        logger.info("Relaying alerts from Redis channel %s", settings.REDIS_ALERTS_CHANNEL)
+
+    async def stop_pubsub(self) -> None:
+        """Stop the Redis relay and close the client, if running."""
+        if self._relay_task is not None:
+            self._relay_task.cancel()
+            try:
+                await self._relay_task
+            except asyncio.CancelledError:
+                pass
+            self._relay_task = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
     async def broadcast(self, message: dict) -> None:  # type: ignore[type-arg]
-        """Broadcast a message to all connected WebSocket clients.
+        """Deliver a message to every connected client across all workers.
 
-        Automatically cleans up connections that fail to receive the message.
+        Publishes to Redis when pub/sub is running (each worker's relay then
+        fans out locally); otherwise fans out in this process directly.  If
+        the publish fails the message is delivered to this process's clients
+        only, so an outage never aborts the ingest that produced it.
 
         Args:
             message: Dictionary payload to send as JSON to all clients.
         """
-        disconnected: list[WebSocket] = []
-        for connection in self.active_connections:
+        if self._redis is not None:
+            try:
+                await self._redis.publish(get_settings().REDIS_ALERTS_CHANNEL, _encode(message))
+                return
+            except Exception:
+                logger.exception("Redis publish failed -- broadcasting to local clients only")
+        self._broadcast_local(message)
+
+    def _broadcast_local(self, message: dict[str, Any]) -> None:
+        """Queue a message for delivery to this process's WebSocket clients.
+
+        Messages are buffered for up to ``COALESCE_WINDOW_SECONDS`` (or until
+        ``COALESCE_MAX_ITEMS`` accumulate) and then sent as a single batch
+        frame.
+
+        Args:
+            message: Dictionary payload to send as JSON to all clients.
+        """
+        if not self.active_connections:
+            return
+        self._pending.append(message)
+        if len(self._pending) >= COALESCE_MAX_ITEMS:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                COALESCE_WINDOW_SECONDS, self._flush,
+            )
+
+    def _flush(self) -> None:
+        """Encode the pending messages once and enqueue them for every client.
+
+        Fans out over a snapshot of the active set; clients whose queue is
+        full are collected and removed in one bulk update afterwards, and
+        their sockets closed with ``SLOW_CLIENT_CLOSE_CODE`` so they
+        reconnect.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+        items, self._pending = self._pending, []
+        payload = _encode({"type": "batch", "items": items})
+        slow: list[WebSocket] = []
+        for conn in tuple(self.active_connections):
+            queue = self._queues.get(conn)
+            if queue is None:
+                continue
             try:
-                await connection.send_json(message)
+                queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                slow.append(conn)
+
+        if slow:
+            self.active_connections.difference_update(slow)
+            for conn in slow:
+                self._release(conn)
+                self._schedule_close(conn, SLOW_CLIENT_CLOSE_CODE)
+            logger.warning(
+                "Dropped %d slow WebSocket client(s). Total: %d",
+                len(slow),
+                len(self.active_connections),
+            )
+
+    async def _relay_loop(self, channel: str) -> None:
+        """Fan out every message published on the alerts channel locally.
+
+        Re-subscribes with exponential backoff whenever the subscription
+        connection fails, so a Redis restart doesn't silently stop this
+        worker's dashboards.
+
+        Args:
+            channel: Pub/sub channel to subscribe to.
+        """
+        delay = RELAY_RETRY_INITIAL_SECONDS
+        while True:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.subscribe(channel)
+                delay = RELAY_RETRY_INITIAL_SECONDS
+                async for item in pubsub.listen():
+                    if item.get("type") != "message":
+                        continue
+                    try:
+                        self._broadcast_local(_decode(item["data"]))
+                    except ValueError:
+                        logger.warning("Dropping malformed alert from Redis channel")
+            except asyncio.CancelledError:
+                raise
             except Exception:
-                disconnected.append(connection)
-        for conn in disconnected:
-            self.disconnect(conn)
+                logger.exception("Redis relay failed -- reconnecting in %.1fs", delay)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    logger.debug("Redis pubsub already closed")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RELAY_RETRY_MAX_SECONDS)
+
+    async def _writer_loop(
+        self,
+        websocket: WebSocket,
+        queue: asyncio.Queue[str],
+    ) -> None:
+        """Drain *queue* onto *websocket* until the connection fails.
+
+        Args:
+            websocket: The connection this task writes to.
+            queue: The connection's outbound frame queue.
+        """
+        try:
+            while True:
+                payload = await queue.get()
+                await websocket.send_text(payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.disconnect(websocket)
 
 
 manager = ConnectionManager()
@@ -3,34 +3,54 @@
 This module provides:
 
 - ``Base``          — declarative base class shared by all ORM models.
+- ``TransactionStatus`` — enumeration of ``Transaction.status`` values.
 - ``Transaction``   — ORM model representing an ingested e-commerce transaction.
 - ``FraudAlert``    — ORM model representing a fraud alert raised for a transaction.
-- ``engine``        — shared ``AsyncEngine`` instance.
-- ``async_session`` — ``async_sessionmaker`` factory bound to ``engine``.
-- ``get_db``        — async generator for use with FastAPI ``Depends``.
+- ``AlertRule``     — ORM model with one row per rule that fired for an alert.
+- ``write_engine``  — single-connection ``AsyncEngine`` for all writes
+  (``engine`` is an alias).
+- ``read_engine``   — read-only ``AsyncEngine`` pool for API queries.  The same
+  object as ``write_engine`` for non-SQLite or in-memory databases.
+- ``async_session_write`` / ``async_session_read`` — ``async_sessionmaker``
+  factories bound to the two engines (``async_session`` aliases the writer).
+- ``get_db``        — async generator yielding a write session, for FastAPI ``Depends``.
+- ``get_read_db``   — async generator yielding a read-only session, for GET endpoints.
 - ``create_tables`` — coroutine that issues ``CREATE TABLE IF NOT EXISTS`` for all models.
 
 SQLite is configured to run in WAL (Write-Ahead Logging) mode so that concurrent
 read queries from the API are never blocked by an ongoing ingestion write.
+Reads go through a separate read-only connection pool so they never queue
+behind the writer at the SQLAlchemy pool level either.
 """
 
 from __future__ import annotations
 
+import os
 from collections.abc import AsyncGenerator
+from enum import StrEnum
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speed-up
+    orjson = None
+
 from sqlalchemy import (
     Boolean,
     DateTime,
+    Enum,
     Float,
     ForeignKey,
     Index,
     Integer,
+    SmallInteger,
     String,
     event,
     func,
+    make_url,
     text,
 )
+from sqlalchemy.engine import URL
 from sqlalchemy.ext.asyncio import (
     AsyncConnection,
     AsyncEngine,
@@ -39,6 +59,7 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from src.config import settings
 
@@ -47,12 +68,23 @@ from src.config import settings
 # ---------------------------------------------------------------------------
 
 
-def _set_sqlite_wal(dbapi_connection: Any, connection_record: Any) -> None:  # noqa: ANN401
-    """Enable WAL mode immediately after each new SQLite connection is created.
+def _set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:  # noqa: ANN401
+    """Configure each new SQLite connection for a concurrent server workload.
 
     WAL mode allows concurrent readers alongside a single writer, which is
     critical for the dashboard querying the database while the ingestion
-    pipeline is writing new transaction rows.
+    pipeline is writing new transaction rows.  The remaining pragmas:
+
+    - ``synchronous=NORMAL`` -- in WAL mode, fsync only at checkpoints rather
+      than on every commit; still safe against application crashes.
+    - ``busy_timeout=5000``  -- wait up to 5 s for a lock instead of failing
+      immediately with ``SQLITE_BUSY``.
+    - ``temp_store=MEMORY``  -- keep temporary b-trees (sorts, GROUP BY) in RAM.
+    - ``cache_size=-64000``  -- 64 MB page cache per connection.
+    - ``foreign_keys=ON``    -- enforce the declared foreign keys.
+
+    The driver's own implicit ``BEGIN`` is disabled so that
+    :func:`_begin_immediate` controls how write transactions start.
 
     Args:
         dbapi_connection: The raw DBAPI connection handed to the listener by
@@ -62,28 +94,153 @@ def _set_sqlite_wal(dbapi_connection: Any, connection_record: Any) -> None:  # n
     """
     cursor = dbapi_connection.cursor()
     cursor.execute("PRAGMA journal_mode=WAL;")
+    cursor.execute("PRAGMA synchronous=NORMAL;")
+    cursor.execute("PRAGMA busy_timeout=5000;")
+    cursor.execute("PRAGMA temp_store=MEMORY;")
+    cursor.execute("PRAGMA cache_size=-64000;")
+    cursor.execute("PRAGMA foreign_keys=ON;")
     cursor.close()
+    dbapi_connection.isolation_level = None
+
+
+def _begin_immediate(conn: Any) -> None:  # noqa: ANN401
+    """Start every write transaction with ``BEGIN IMMEDIATE``.
+
+    A deferred ``BEGIN`` only takes the write lock at the first flush, and
+    that lock upgrade fails with ``SQLITE_BUSY`` (bypassing ``busy_timeout``)
+    when another process is already writing.  Taking the lock up front makes
+    competing writers wait on ``busy_timeout`` instead.
+
+    Args:
+        conn: The SQLAlchemy ``Connection`` passed by the ``begin`` event.
+    """
+    conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+def _set_sqlite_read_pragmas(dbapi_connection: Any, connection_record: Any) -> None:  # noqa: ANN401
+    """Configure each new read-only SQLite connection.
+
+    Readers share the writer's lock-wait and cache settings but never change
+    the journal mode, and ``query_only`` guards against accidental writes.
+
+    Args:
+        dbapi_connection: The raw DBAPI connection handed to the listener by
+            SQLAlchemy's ``connect`` event.
+        connection_record: Internal SQLAlchemy connection pool record
+            (not used here but required by the event signature).
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA busy_timeout=5000;")
+    cursor.execute("PRAGMA temp_store=MEMORY;")
+    cursor.execute("PRAGMA cache_size=-64000;")
+    cursor.execute("PRAGMA query_only=ON;")
+    cursor.close()
+
+
+def _sqlite_read_only_url(url: str) -> URL | None:
+    """Return a read-only ``file:`` URI variant of a file-backed SQLite URL.
 
+    Args:
+        url: The configured ``DATABASE_URL``.
+
+    Returns:
+        The read-only URL, or ``None`` for non-SQLite and in-memory databases,
+        which cannot be shared across separate connections.
+    """
+    parsed = make_url(url)
+    database = parsed.database
+    if parsed.get_backend_name() != "sqlite" or not database or database == ":memory:":
+        return None
+    return parsed.set(
+        database=f"file:{database}",
+        query={**parsed.query, "mode": "ro", "uri": "true"},
+    )
+
+
+def _orjson_serializer(value: Any) -> str:  # noqa: ANN401
+    """Encode a JSON column value with orjson, returning ``str`` as SQLAlchemy expects."""
+    return orjson.dumps(value).decode()
 
-engine: AsyncEngine = create_async_engine(
+
+# JSON columns (``triggered_rules``) are encoded/decoded with orjson when
+# available instead of the stdlib ``json`` module.
+_JSON_OPTIONS: dict[str, Any] = (
+    {"json_serializer": _orjson_serializer, "json_deserializer": orjson.loads}
+    if orjson is not None
+    else {}
+)
+
+# Compiled-statement cache entries per engine (SQLAlchemy's default is 500).
+# Ingestion, rule, and dashboard queries together exceed the default once
+# per-dialect and per-parameter-shape variants are counted.
+QUERY_CACHE_SIZE = 1200
+
+_IS_SQLITE = "sqlite" in settings.DATABASE_URL
+_READ_URL = _sqlite_read_only_url(settings.DATABASE_URL)
+
+# SQLite allows a single writer, so the write pool holds exactly one
+# connection: writers queue in the pool instead of contending for the lock.
+write_engine: AsyncEngine = create_async_engine(
     settings.DATABASE_URL,
     echo=False,
     future=True,
+    query_cache_size=QUERY_CACHE_SIZE,
+    **_JSON_OPTIONS,
+    **(
+        {"poolclass": AsyncAdaptedQueuePool, "pool_size": 1, "max_overflow": 0}
+        if _READ_URL is not None
+        else {}
+    ),
 )
 
-# Register WAL mode only when the backend is SQLite.
-if "sqlite" in settings.DATABASE_URL:
-    event.listen(engine.sync_engine, "connect", _set_sqlite_wal)
+# WAL readers never block the writer (or each other), so dashboard reads get
+# their own read-only pool.
+read_engine: AsyncEngine = (
+    create_async_engine(
+        _READ_URL,
+        echo=False,
+        future=True,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=os.cpu_count() or 1,
+        # Reads never need a transaction of their own, so skip the BEGIN.
+        isolation_level="AUTOCOMMIT",
+        query_cache_size=QUERY_CACHE_SIZE,
+        **_JSON_OPTIONS,
+    )
+    if _READ_URL is not None
+    else write_engine
+)
+
+# Backwards-compatible alias for callers that predate the read/write split.
+engine: AsyncEngine = write_engine
+
+# Register the SQLite pragmas only when the backend is SQLite.
+if _IS_SQLITE:
+    event.listen(write_engine.sync_engine, "connect", _set_sqlite_pragmas)
+    event.listen(write_engine.sync_engine, "begin", _begin_immediate)
+    if read_engine is not write_engine:
+        event.listen(read_engine.sync_engine, "connect", _set_sqlite_read_pragmas)
 
 
-async_session: async_sessionmaker[AsyncSession] = async_sessionmaker(
-    bind=engine,
+async_session_write: async_sessionmaker[AsyncSession] = async_sessionmaker(
+    bind=write_engine,
     class_=AsyncSession,
     expire_on_commit=False,
     autoflush=False,
     autocommit=False,
 )
 
+async_session_read: async_sessionmaker[AsyncSession] = async_sessionmaker(
+    bind=read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+    autocommit=False,
+)
+
+# Backwards-compatible alias for the write session factory.
+async_session: async_sessionmaker[AsyncSession] = async_session_write
+
 # ---------------------------------------------------------------------------
 # Declarative base
 # ---------------------------------------------------------------------------
@@ -102,24 +259,44 @@ class Base(DeclarativeBase):
 # ---------------------------------------------------------------------------
 
 
+class TransactionStatus(StrEnum):
+    """Outcome of a payment attempt, stored in ``transactions.status``.
+
+    A ``StrEnum``, so members compare equal to (and serialise as) their plain
+    string values.  On PostgreSQL the column is a native ``ENUM``; SQLite
+    stores the value as ``VARCHAR``.
+    """
+
+    APPROVED = "APPROVED"
+    SOFT_DECLINED = "SOFT_DECLINED"
+    HARD_DECLINED = "HARD_DECLINED"
+
+
 class Transaction(Base):
     """ORM model for the ``transactions`` table.
 
     Each row represents a single e-commerce transaction ingested from the
     CSV feed or via the POST /transactions REST endpoint.
 
-    Indexed columns:
-        - ``customer_email`` — used heavily by velocity and decline-rate rules.
-        - ``customer_ip``    — used for IP-based suspicious activity lookups.
-        - ``card_bin``       — used for BIN-level fraud pattern detection.
+    Composite indexes (each also serves lookups on its leading column):
+        - ``(customer_email, timestamp, status)`` — the velocity/decline-rate
+          counter query (covering: ``status`` is read from the index) and
+          related-by-email lookups ordered by time.
+        - ``(customer_ip, timestamp)``    — related-by-IP lookups.
+        - ``(card_bin, timestamp)``       — related-by-BIN lookups.
     """
 
     __tablename__ = "transactions"
 
     __table_args__ = (
-        Index("ix_transactions_customer_email", "customer_email"),
-        Index("ix_transactions_customer_ip", "customer_ip"),
-        Index("ix_transactions_card_bin", "card_bin"),
+        Index(
+            "ix_transactions_email_ts_status",
+            "customer_email",
+            "timestamp",
+            "status",
+        ),
+        Index("ix_transactions_ip_ts", "customer_ip", "timestamp"),
+        Index("ix_transactions_bin_ts", "card_bin", "timestamp"),
     )
 
     transaction_id: Mapped[str] = mapped_column(
@@ -167,8 +344,8 @@ class Transaction(Base):
         nullable=False,
         doc="Total transaction amount in United States Dollars.",
     )
-    status: Mapped[str] = mapped_column(
-        String,
+    status: Mapped[TransactionStatus] = mapped_column(
+        Enum(TransactionStatus, name="transaction_status"),
         nullable=False,
         doc="Transaction outcome. One of: APPROVED, SOFT_DECLINED, HARD_DECLINED.",
     )
@@ -226,14 +403,29 @@ class FraudAlert(Base):
         - ``INVESTIGATED``     — analyst has started reviewing.
         - ``CLEARED``          — analyst confirmed the transaction is legitimate.
         - ``CONFIRMED_FRAUD``  — analyst confirmed fraudulent activity.
+
+    Composite indexes:
+        - ``(created_at, alert_status, risk_score)`` — the time-window,
+          status, and minimum-score filters used by the alert list and
+          metrics endpoints.  Covering on PostgreSQL via ``INCLUDE``.
     """
 
     __tablename__ = "fraud_alerts"
 
+    __table_args__ = (
+        Index(
+            "ix_fraud_alerts_created_status_risk",
+            "created_at",
+            "alert_status",
+            "risk_score",
+            postgresql_include=["alert_id", "transaction_id"],
+        ),
+    )
+
     alert_id: Mapped[str] = mapped_column(
         String,
         primary_key=True,
-        doc="UUID string generated at alert creation time.",
+        doc="Time-ordered (UUIDv7 layout) string generated at alert creation time.",
     )
     transaction_id: Mapped[str] = mapped_column(
         String,
@@ -246,6 +438,12 @@ class FraudAlert(Base):
         nullable=False,
         doc="Composite risk score in the range [0, 100] computed by the scorer.",
     )
+    risk_bucket: Mapped[int] = mapped_column(
+        SmallInteger,
+        nullable=False,
+        index=True,
+        doc="Risk score decile 0-9 (scores of 90-100 share bucket 9), set at insert.",
+    )
     triggered_rules: Mapped[Any] = mapped_column(
         # SQLAlchemy's JSON type stores Python lists/dicts as JSON strings in
         # SQLite and as native JSONB in PostgreSQL.
@@ -264,6 +462,12 @@ class FraudAlert(Base):
         server_default=func.now(),
         doc="Database row insertion timestamp (server-side default).",
     )
+    hour_bucket: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        index=True,
+        doc="UTC epoch hour of ``created_at`` (POSIX seconds // 3600), set at insert.",
+    )
     updated_at: Mapped[DateTime | None] = mapped_column(
         DateTime,
         onupdate=func.now(),
@@ -278,6 +482,45 @@ class FraudAlert(Base):
         lazy="select",
     )
 
+    # Relationship — one row per triggered rule; also orders the INSERTs so
+    # the alert is written before its ``alert_rules`` rows.
+    rules: Mapped[list[AlertRule]] = relationship(
+        "AlertRule",
+        cascade="all, delete-orphan",
+        lazy="select",
+    )
+
+
+class AlertRule(Base):
+    """ORM model for the ``alert_rules`` table.
+
+    Denormalised copy of ``FraudAlert.triggered_rules`` with one row per
+    (alert, rule) pair, written at ingest time.  Lets the metrics endpoint
+    count rule frequency with a plain ``GROUP BY`` instead of unnesting the
+    JSON array of every alert.
+
+    Indexed columns:
+        - ``rule_name`` — grouped on by the top-triggered-rules metric.
+    """
+
+    __tablename__ = "alert_rules"
+
+    __table_args__ = (
+        Index("ix_alert_rules_rule_name", "rule_name"),
+    )
+
+    alert_id: Mapped[str] = mapped_column(
+        String,
+        ForeignKey("fraud_alerts.alert_id"),
+        primary_key=True,
+        doc="Foreign key reference to the alert the rule contributed to.",
+    )
+    rule_name: Mapped[str] = mapped_column(
+        String,
+        primary_key=True,
+        doc="Label of the rule that fired, e.g. ``VELOCITY``.",
+    )
+
 
 # ---------------------------------------------------------------------------
 # Database lifecycle helpers
@@ -309,7 +552,7 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     back) when the request context exits, whether normally or via an exception.
 
     Yields:
-        AsyncSession: A live SQLAlchemy async session bound to ``engine``.
+        AsyncSession: A live SQLAlchemy async session bound to ``write_engine``.
 
     Example::
 
@@ -321,7 +564,23 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             result = await db.execute(select(Transaction))
             return result.scalars().all()
     """
-    async with async_session() as session:
+    async with async_session_write() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """Async generator that yields a read-only session for each request.
+
+    Use for endpoints that only query; sessions come from ``read_engine`` so
+    dashboard reads run concurrently with ingestion writes.
+
+    Yields:
+        AsyncSession: A live SQLAlchemy async session bound to ``read_engine``.
+    """
+    async with async_session_read() as session:
         try:
             yield session
         finally:
@@ -5,8 +5,11 @@ the full lifecycle of a transaction: persistence, rule evaluation, risk
 scoring, alert generation, and optional real-time broadcast via WebSocket.
 
 Supported ingestion sources:
-    - JSON files on disk (``ingest_from_json``)
+    - JSON files on disk (``ingest_from_json``).  Newline-delimited
+      ``.ndjson`` / ``.jsonl`` files are streamed line by line; JSON arrays
+      are streamed with ``ijson`` when it is installed
     - In-memory transaction lists (``ingest_from_list``)
+    - Lazy transaction iterables (``ingest_from_iter``)
 """
 
 from __future__ import annotations
@@ -14,17 +17,43 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import os
+import random
 import time
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Iterable, Iterator, Sized
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
 from typing import Any
-from uuid import uuid4
-
-from sqlalchemy import select
+from uuid import UUID
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speed-up
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - ijson is optional for streaming arrays
+    ijson = None
+
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:  # pragma: no cover - ciso8601 is an optional speed-up
+    _parse_datetime = datetime.fromisoformat
+
+from sqlalchemy import insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.models.database import FraudAlert, Transaction, async_session
+from src.models.database import (
+    AlertRule,
+    FraudAlert,
+    Transaction,
+    async_session_write,
+)
 from src.pipeline.risk_scorer import RiskScorer, ScoreResult
 from src.pipeline.rules_engine import RulesEngine
 
@@ -33,6 +62,141 @@ logger = logging.getLogger(__name__)
 # Type alias for the optional WebSocket broadcast callback.
 BroadcastCallback = Callable[[dict[str, Any]], Coroutine[Any, Any, None]]
 
+_UTC = timezone.utc
+
+# Attempts per batch when SQLite reports the database as locked, and the
+# base of the exponential back-off between them (0.05 s, 0.1 s, 0.2 s, ...).
+COMMIT_ATTEMPTS = 5
+COMMIT_RETRY_BASE_SECONDS = 0.05
+
+# File suffixes treated as newline-delimited JSON (one object per line).
+NDJSON_SUFFIXES: frozenset[str] = frozenset({".ndjson", ".jsonl"})
+
+
+def _loads(raw: bytes) -> Any:  # noqa: ANN401
+    """Decode JSON bytes with orjson when available, else the stdlib."""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _iter_ndjson(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield one transaction per non-blank line of an NDJSON file.
+
+    The file stays open only while the generator is being consumed, so
+    memory is bounded by a single line regardless of file size.
+
+    Args:
+        path: Path to the newline-delimited JSON file.
+
+    Yields:
+        Decoded transaction dictionaries in file order.
+    """
+    with path.open("rb") as fh:
+        for line in fh:
+            if line.strip():
+                yield _loads(line)
+
+
+def _iter_json_array(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield the elements of a top-level JSON array one at a time.
+
+    Requires ``ijson``.  Floats are decoded as ``float`` rather than
+    ``Decimal`` so rows match what ``json.loads`` would produce.
+
+    Args:
+        path: Path to the JSON array file.
+
+    Yields:
+        Decoded transaction dictionaries in array order.
+    """
+    with path.open("rb") as fh:
+        yield from ijson.items(fh, "item", use_float=True)
+
+
+# Source of the random alert-id bits.  Seeded from the OS once per process;
+# unlike ``uuid4`` it does not read ``os.urandom`` for every id.  Reseeded in
+# forked children so preloaded workers don't share a bit stream.
+_alert_id_random = random.Random()
+if hasattr(os, "register_at_fork"):  # pragma: no branch - absent on Windows
+    os.register_at_fork(after_in_child=_alert_id_random.seed)
+
+
+def _new_alert_id(created_at: datetime) -> str:
+    """Generate a time-ordered, UUIDv7-layout alert id.
+
+    The 48-bit millisecond timestamp leads, so ids are roughly increasing
+    and new ``fraud_alerts`` rows append to the right edge of the primary
+    key B-tree instead of landing on random pages.
+
+    Args:
+        created_at: Alert creation time supplying the timestamp bits.
+
+    Returns:
+        The id as a canonical 36-character UUID string.
+    """
+    millis = int(created_at.timestamp() * 1000)
+    rand = _alert_id_random.getrandbits(74)
+    value = (
+        (millis << 80)
+        | (0x7 << 76)                    # version 7
+        | ((rand >> 62) << 64)           # 12 random bits
+        | (0b10 << 62)                   # RFC 4122 variant
+        | (rand & ((1 << 62) - 1))       # 62 random bits
+    )
+    return str(UUID(int=value))
+
+
+# Per-dialect ``INSERT ... ON CONFLICT DO NOTHING`` statements, built once
+# so each row only binds parameters against a cached compiled form.  They
+# target the Core table so execution returns a plain cursor result with a
+# ``rowcount`` rather than going through the ORM bulk-insert path.
+_INSERT_IGNORE: dict[str, Any] = {
+    "postgresql": postgresql_insert(Transaction.__table__).on_conflict_do_nothing(
+        index_elements=["transaction_id"],
+    ),
+    "sqlite": sqlite_insert(Transaction.__table__).on_conflict_do_nothing(
+        index_elements=["transaction_id"],
+    ),
+}
+
+# The same statements reporting which rows were actually inserted, for the
+# multi-row batch insert where a single ``rowcount`` cannot say which rows
+# were duplicates.
+_INSERT_IGNORE_RETURNING: dict[str, Any] = {
+    dialect: stmt.returning(Transaction.__table__.c.transaction_id)
+    for dialect, stmt in _INSERT_IGNORE.items()
+}
+
+
+def _insert_ignore(session: AsyncSession, *, returning: bool = False) -> Any:  # noqa: ANN401
+    """Return the transaction ``INSERT`` that ignores a duplicate key.
+
+    Args:
+        session: Session whose bind determines the SQL dialect.
+        returning: Return the variant with ``RETURNING transaction_id``.
+
+    Returns:
+        An ``INSERT ... ON CONFLICT (transaction_id) DO NOTHING`` statement
+        (``INSERT OR IGNORE`` semantics on SQLite), executed with the row's
+        column values as parameters.
+    """
+    statements = _INSERT_IGNORE_RETURNING if returning else _INSERT_IGNORE
+    return statements.get(session.get_bind().dialect.name, statements["sqlite"])
+
+
+def _normalise_timestamp(tx_data: dict[str, Any]) -> None:
+    """Replace a string ``timestamp`` in ``tx_data`` by a UTC-aware ``datetime``.
+
+    Args:
+        tx_data: Raw transaction dictionary, updated in place.
+    """
+    raw_ts = tx_data.get("timestamp")
+    if isinstance(raw_ts, str):
+        parsed = _parse_datetime(raw_ts)
+        # Ensure timezone-aware (UTC) so rule engine comparisons don't fail
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=_UTC)
+        tx_data["timestamp"] = parsed
+
 
 class FraudDetectionPipeline:
     """End-to-end fraud detection pipeline.
@@ -60,114 +224,116 @@ class FraudDetectionPipeline:
         self.scorer = RiskScorer()
         self.processed_count: int = 0
         self.flagged_count: int = 0
+        # Alert and alert-rule rows awaiting a bulk Core INSERT at commit.
+        self._pending_alerts: list[dict[str, Any]] = []
+        self._pending_alert_rules: list[dict[str, Any]] = []
+        # Side effects held back until the batch has committed, so a batch
+        # that is rolled back and retried neither double-counts nor sends
+        # alerts for rows that were never stored.
+        self._pending_broadcasts: list[dict[str, Any]] = []
+        self._pending_processed: int = 0
+        self._pending_flagged: int = 0
 
     async def process_transaction(
         self,
         tx_data: dict[str, Any],
         session: AsyncSession,
+        *,
+        commit: bool = True,
     ) -> ScoreResult | None:
         """Process a single transaction through the fraud detection pipeline.
 
         Steps:
-            1. Deduplicate -- skip if ``transaction_id`` already exists.
-            2. Persist the transaction.
-            3. Evaluate all fraud rules.
-            4. Calculate the composite risk score.
-            5. If flagged, persist a ``FraudAlert`` and broadcast.
+            1. Insert the transaction, ignoring a duplicate ``transaction_id``
+               -- skip the remaining steps if nothing was inserted.
+            2. Evaluate all fraud rules.
+            3. Calculate the composite risk score.
+            4. If flagged, queue a ``FraudAlert`` row and its broadcast.
+
+        Counters and broadcasts take effect once the session commits.
 
         Args:
             tx_data: Raw transaction dictionary (field names matching the
                 ``Transaction`` ORM model).
             session: Active async database session.
+            commit: Commit the session once the transaction is processed.
+                Pass ``False`` when the caller commits a batch of rows
+                together; the transaction row is inserted immediately so
+                later rule queries in the same session see it, while alert
+                rows are queued until the caller runs ``flush_alerts``,
+                commits, then calls ``publish_committed``.
 
         Returns:
             A ``ScoreResult`` on success, or ``None`` when the transaction
             was skipped as a duplicate.
         """
-        transaction_id: str = tx_data.get("transaction_id", "")
-
-        # --- 1. Duplicate check -------------------------------------------
-        existing_stmt = select(Transaction).where(
-            Transaction.transaction_id == transaction_id,
-        )
-        existing = await session.scalar(existing_stmt)
-        if existing is not None:
-            logger.warning(
-                "Duplicate transaction %s -- skipping", transaction_id,
-            )
+        # --- 1. Persist transaction, skipping duplicates --------------------
+        transaction = await self._insert_transaction(tx_data, session)
+        if transaction is None:
             return None
 
-        # --- 2. Persist transaction ----------------------------------------
-        # Normalise the timestamp if it arrives as a string.
-        raw_ts = tx_data.get("timestamp")
-        if isinstance(raw_ts, str):
-            parsed = datetime.fromisoformat(raw_ts)
-            # Ensure timezone-aware (UTC) so rule engine comparisons don't fail
-            if parsed.tzinfo is None:
-                parsed = parsed.replace(tzinfo=timezone.utc)
-            tx_data["timestamp"] = parsed
-
-        transaction = Transaction(**tx_data)
-        session.add(transaction)
-        await session.flush()  # Ensure the row is visible to rule queries.
-
-        # --- 3. Evaluate rules ---------------------------------------------
-        rule_results = await self.rules_engine.evaluate_all(transaction, session)
+        # --- 2-3. Evaluate rules and calculate risk score -----------------
+        score_result = await self.rules_engine.evaluate_and_score(
+            transaction, session, self.scorer.threshold,
+        )
 
-        # --- 4. Calculate risk score ---------------------------------------
-        score_result = self.scorer.calculate(rule_results)
+        # --- 4. Flag and alert if necessary --------------------------------
+        self._queue_result(transaction, score_result)
+        if commit:
+            await self.flush_alerts(session)
+            await session.commit()
+            await self.publish_committed()
+        return score_result
 
-        # --- 5. Flag and alert if necessary --------------------------------
-        if score_result.is_flagged:
-            alert = FraudAlert(
-                alert_id=str(uuid4()),
-                transaction_id=transaction_id,
-                risk_score=score_result.risk_score,
-                triggered_rules=score_result.triggered_rules,
-                alert_status="NEW",
-                created_at=datetime.now(timezone.utc),
-            )
-            session.add(alert)
-            self.flagged_count += 1
+    async def flush_alerts(self, session: AsyncSession) -> None:
+        """Insert all queued alert rows with one Core ``INSERT`` per table.
 
-            logger.warning(
-                "FRAUD ALERT for %s -- score %d, rules %s",
-                transaction_id,
-                score_result.risk_score,
-                score_result.triggered_rules,
-            )
+        Bypasses the ORM unit of work: the rows go straight to an
+        ``executemany``.  Alerts are written before their rule rows so the
+        ``alert_rules`` foreign key is satisfied.
 
-            if self.broadcast_callback is not None:
-                alert_data: dict[str, Any] = {
-                    "alert_id": alert.alert_id,
-                    "transaction_id": transaction_id,
-                    "risk_score": score_result.risk_score,
-                    "triggered_rules": score_result.triggered_rules,
-                    "alert_status": "NEW",
-                    "amount_usd": transaction.amount_usd,
-                    "customer_email": transaction.customer_email,
-                    "product_category": transaction.product_category,
-                }
+        Args:
+            session: The session the queued alerts' transactions were
+                inserted in; the caller commits it.
+        """
+        if not self._pending_alerts:
+            return
+        await session.execute(insert(FraudAlert.__table__), self._pending_alerts)
+        await session.execute(insert(AlertRule.__table__), self._pending_alert_rules)
+        self._pending_alerts = []
+        self._pending_alert_rules = []
+
+    async def publish_committed(self) -> None:
+        """Apply the counters and send the broadcasts of committed rows."""
+        self.processed_count += self._pending_processed
+        self.flagged_count += self._pending_flagged
+        broadcasts = self._pending_broadcasts
+        self._discard_pending()
+        if self.broadcast_callback is not None:
+            for alert_data in broadcasts:
                 await self.broadcast_callback(alert_data)
 
-        await session.commit()
-        self.processed_count += 1
-        return score_result
-
     async def ingest_from_json(
         self,
         file_path: str,
         delay_seconds: float = 0.0,
+        batch_size: int = 1,
     ) -> dict[str, Any]:
         """Ingest transactions from a JSON file.
 
         The file must contain a JSON array of transaction objects at the
-        top level.
+        top level, or -- for ``.ndjson`` / ``.jsonl`` files -- one object per
+        line.  NDJSON files, and JSON arrays when ``ijson`` is installed, are
+        parsed lazily as the pipeline consumes them, so the first row is
+        processed before the whole file has been read.
 
         Args:
             file_path: Path to the JSON file.
             delay_seconds: Artificial delay between transactions to simulate
                 real-time arrival.
+            batch_size: Number of transactions committed together and
+                processed between event-loop sleeps.  The sleep is scaled to
+                the batch length so the overall pacing is unchanged.
 
         Returns:
             A summary dictionary with keys ``total``, ``flagged``, and
@@ -176,66 +342,298 @@ class FraudDetectionPipeline:
         path = Path(file_path)
         logger.info("Loading transactions from %s", path.resolve())
 
-        with path.open("r", encoding="utf-8") as fh:
-            transactions: list[dict[str, Any]] = json.load(fh)
+        transactions: Iterable[dict[str, Any]]
+        if path.suffix.lower() in NDJSON_SUFFIXES:
+            transactions = _iter_ndjson(path)
+        elif ijson is not None:
+            transactions = _iter_json_array(path)
+        else:
+            # Parse straight from bytes: orjson skips the text-decoding step
+            # and builds the Python objects in a single native pass.
+            transactions = _loads(path.read_bytes())
 
-        return await self._ingest(transactions, delay_seconds)
+        return await self._ingest(transactions, delay_seconds, batch_size)
 
     async def ingest_from_list(
         self,
         transactions: list[dict[str, Any]],
         delay_seconds: float = 0.0,
+        batch_size: int = 1,
     ) -> dict[str, Any]:
         """Ingest transactions from an in-memory list.
 
         Args:
             transactions: List of transaction dictionaries.
             delay_seconds: Artificial delay between transactions.
+            batch_size: Number of transactions committed together.
 
         Returns:
             A summary dictionary identical to ``ingest_from_json``.
         """
-        return await self._ingest(transactions, delay_seconds)
+        return await self._ingest(transactions, delay_seconds, batch_size)
+
+    async def ingest_from_iter(
+        self,
+        transactions: Iterable[dict[str, Any]],
+        delay_seconds: float = 0.0,
+        batch_size: int = 1,
+    ) -> dict[str, Any]:
+        """Ingest transactions from any iterable, consuming it lazily.
+
+        Use with a generator (e.g. ``iter_dataset``) to keep memory bounded
+        for large runs: rows are pulled one at a time and never collected.
+
+        Args:
+            transactions: Iterable of transaction dictionaries.
+            delay_seconds: Artificial delay between transactions.
+            batch_size: Number of transactions committed together.
+
+        Returns:
+            A summary dictionary identical to ``ingest_from_json``.
+        """
+        return await self._ingest(transactions, delay_seconds, batch_size)
 
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
 
+    async def _insert_transaction(
+        self,
+        tx_data: dict[str, Any],
+        session: AsyncSession,
+    ) -> Transaction | None:
+        """Insert one transaction row, ignoring a duplicate ``transaction_id``.
+
+        Args:
+            tx_data: Raw transaction dictionary; a string ``timestamp`` is
+                replaced in place by a UTC-aware ``datetime``.
+            session: Active async database session.
+
+        Returns:
+            A transient ``Transaction`` carrying the row's values (rules only
+            read attributes), or ``None`` when the row was a duplicate.
+        """
+        _normalise_timestamp(tx_data)
+
+        # The primary key does the deduplication: a single INSERT that
+        # ignores conflicts replaces the SELECT-then-INSERT round trips.
+        result = await session.execute(_insert_ignore(session), tx_data)
+        if result.rowcount == 0:
+            logger.warning(
+                "Duplicate transaction %s -- skipping", tx_data.get("transaction_id", ""),
+            )
+            return None
+        return Transaction(**tx_data)
+
+    async def _insert_batch(
+        self,
+        batch: list[dict[str, Any]],
+        session: AsyncSession,
+    ) -> list[Transaction | None]:
+        """Insert a batch of transaction rows, ignoring duplicates.
+
+        Rows go out as one multi-row ``INSERT ... RETURNING`` per distinct
+        key layout (normally just one) instead of one statement per row.
+        As with row-at-a-time inserts, only the first occurrence of a
+        ``transaction_id`` within the batch is kept.
+
+        Args:
+            batch: Raw transaction dicts; string timestamps are normalised
+                in place.
+            session: Active async database session.
+
+        Returns:
+            For each input row, a transient ``Transaction`` when it was
+            inserted or ``None`` when it was a duplicate.
+        """
+        seen: set[str] = set()
+        first_seen: list[bool] = []
+        rows_by_layout: dict[frozenset[str], list[dict[str, Any]]] = {}
+        for tx_data in batch:
+            _normalise_timestamp(tx_data)
+            transaction_id = tx_data.get("transaction_id", "")
+            first_seen.append(transaction_id not in seen)
+            if transaction_id not in seen:
+                seen.add(transaction_id)
+                rows_by_layout.setdefault(frozenset(tx_data), []).append(tx_data)
+
+        # executemany binds every row against the first row's keys, so rows
+        # that omit optional fields (left to column defaults) go separately.
+        stmt = _insert_ignore(session, returning=True)
+        inserted_ids: set[str] = set()
+        for rows in rows_by_layout.values():
+            inserted_ids.update((await session.execute(stmt, rows)).scalars())
+
+        inserted: list[Transaction | None] = []
+        for tx_data, is_first in zip(batch, first_seen):
+            transaction_id = tx_data.get("transaction_id", "")
+            if is_first and transaction_id in inserted_ids:
+                inserted.append(Transaction(**tx_data))
+            else:
+                logger.warning("Duplicate transaction %s -- skipping", transaction_id)
+                inserted.append(None)
+        return inserted
+
+    def _queue_result(self, transaction: Transaction, score_result: ScoreResult) -> None:
+        """Count a scored transaction and queue its alert rows if flagged.
+
+        Args:
+            transaction: The scored transaction.
+            score_result: Its composite score.
+        """
+        if score_result.is_flagged:
+            transaction_id = transaction.transaction_id
+            created_at = datetime.now(_UTC)
+            alert_id = _new_alert_id(created_at)
+            self._pending_alerts.append({
+                "alert_id": alert_id,
+                "transaction_id": transaction_id,
+                "risk_score": score_result.risk_score,
+                "risk_bucket": min(score_result.risk_score // 10, 9),
+                "triggered_rules": score_result.triggered_rules,
+                "alert_status": "NEW",
+                "created_at": created_at,
+                "hour_bucket": int(created_at.timestamp()) // 3600,
+            })
+            self._pending_alert_rules.extend(
+                {"alert_id": alert_id, "rule_name": rule}
+                for rule in score_result.triggered_rules
+            )
+            self._pending_flagged += 1
+
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    "FRAUD ALERT for %s -- score %d, rules %s",
+                    transaction_id,
+                    score_result.risk_score,
+                    score_result.triggered_rules,
+                )
+
+            if self.broadcast_callback is not None:
+                alert_data: dict[str, Any] = {
+                    "alert_id": alert_id,
+                    "transaction_id": transaction_id,
+                    "risk_score": score_result.risk_score,
+                    "triggered_rules": score_result.triggered_rules,
+                    "alert_status": "NEW",
+                    "amount_usd": transaction.amount_usd,
+                    "customer_email": transaction.customer_email,
+                    "product_category": transaction.product_category,
+                }
+                self._pending_broadcasts.append(alert_data)
+
+        self._pending_processed += 1
+
+    def _discard_pending(self) -> None:
+        """Drop all queued rows and side effects (after commit or rollback)."""
+        self._pending_alerts = []
+        self._pending_alert_rules = []
+        self._pending_broadcasts = []
+        self._pending_processed = 0
+        self._pending_flagged = 0
+
+    async def _process_batch(
+        self,
+        batch: list[dict[str, Any]],
+        offset: int,
+        total: int | None,
+    ) -> None:
+        """Process and commit one batch in a single write session.
+
+        Args:
+            batch: Raw transaction dicts to process.
+            offset: Number of rows processed before this batch (for progress).
+            total: Overall row count, when known.
+        """
+        # One session and one commit (and so one fsync) per batch.  All rows
+        # are inserted first so the rules engine can answer the whole batch's
+        # history lookups with a single query.
+        async with async_session_write() as session:
+            inserted = await self._insert_batch(batch, session)
+            new_rows = [transaction for transaction in inserted if transaction is not None]
+            scores = iter(await self.rules_engine.evaluate_batch_and_score(
+                new_rows, session, self.scorer.threshold,
+            ))
+
+            # Per-row progress lines: check the level once per batch rather
+            # than building the args for every row when INFO is off.
+            log_rows = logger.isEnabledFor(logging.INFO)
+            for idx, (tx_data, transaction) in enumerate(zip(batch, inserted), start=offset + 1):
+                if transaction is not None:
+                    score_result = next(scores)
+                    self._queue_result(transaction, score_result)
+                    if log_rows:
+                        logger.info(
+                            "Processed [%d/%s] %s | Score: %d | Rules: %s",
+                            idx,
+                            total if total is not None else "?",
+                            tx_data.get("transaction_id", "UNKNOWN"),
+                            score_result.risk_score,
+                            score_result.triggered_rules,
+                        )
+                elif log_rows:
+                    logger.info(
+                        "Processed [%d/%s] %s | SKIPPED (duplicate)",
+                        idx,
+                        total if total is not None else "?",
+                        tx_data.get("transaction_id", "UNKNOWN"),
+                    )
+
+            await self.flush_alerts(session)
+            await session.commit()
+
     async def _ingest(
         self,
-        transactions: list[dict[str, Any]],
+        transactions: Iterable[dict[str, Any]],
         delay_seconds: float,
+        batch_size: int = 1,
     ) -> dict[str, Any]:
-        """Shared ingestion loop used by both public entry points.
+        """Shared ingestion loop used by the public entry points.
 
         Args:
-            transactions: Ordered list of raw transaction dicts.
+            transactions: Ordered iterable of raw transaction dicts.  Its
+                length is only reported when it supports ``len()``.
             delay_seconds: Inter-transaction delay in seconds.
+            batch_size: Transactions processed per session and committed
+                together; the delay is also applied once per batch
+                (``delay_seconds * len(batch)``).
 
         Returns:
             Pipeline run summary.
         """
-        total = len(transactions)
-        logger.info("Starting ingestion of %d transactions", total)
+        total: int | None = len(transactions) if isinstance(transactions, Sized) else None
+        batch_size = max(1, batch_size)
+        logger.info(
+            "Starting ingestion of %s transactions",
+            total if total is not None else "streamed",
+        )
         start_time = time.perf_counter()
 
-        for idx, tx_data in enumerate(transactions, start=1):
-            tx_id = tx_data.get("transaction_id", "UNKNOWN")
-            async with async_session() as session:
-                score_result = await self.process_transaction(tx_data, session)
-
-            if score_result is not None:
-                triggered = score_result.triggered_rules
-                print(
-                    f"Processing [{idx}/{total}] {tx_id} | "
-                    f"Score: {score_result.risk_score} | "
-                    f"Rules: {triggered}"
-                )
-            else:
-                print(f"Processing [{idx}/{total}] {tx_id} | SKIPPED (duplicate)")
-
+        rows = iter(transactions)
+        offset = 0
+        while batch := list(islice(rows, batch_size)):
+            # A locked database (another process holding the write lock past
+            # busy_timeout) rolls the batch back; replay it with back-off.
+            for attempt in range(COMMIT_ATTEMPTS):
+                try:
+                    await self._process_batch(batch, offset, total)
+                    break
+                except OperationalError as exc:
+                    self._discard_pending()
+                    if "locked" not in str(exc) or attempt == COMMIT_ATTEMPTS - 1:
+                        raise
+                    delay = COMMIT_RETRY_BASE_SECONDS * 2**attempt
+                    logger.warning(
+                        "Database locked on batch at row %d (attempt %d/%d) -- retrying in %.2fs",
+                        offset + 1, attempt + 1, COMMIT_ATTEMPTS, delay,
+                    )
+                    await asyncio.sleep(delay)
+            await self.publish_committed()
+            offset += len(batch)
+
+            # One sleep per batch; skipped entirely when no delay is wanted.
             if delay_seconds > 0:
-                await asyncio.sleep(delay_seconds)
+                await asyncio.sleep(delay_seconds * len(batch))
 
         elapsed = time.perf_counter() - start_time
         summary: dict[str, Any] = {
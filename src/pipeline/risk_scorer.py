@@ -8,13 +8,20 @@ per-rule breakdown for audit and dashboard display.
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-from src.config import settings
-from src.pipeline.rules_engine import RuleResult
+from src.config import get_settings
+
+if TYPE_CHECKING:
+    # Annotation-only: rules_engine imports ScoreResult from this module.
+    from src.pipeline.rules_engine import RuleResult
 
 logger = logging.getLogger(__name__)
 
+# Maximum composite risk score; the sum of rule deltas is capped at this value.
+SCORE_CAP = 100
+
 
 @dataclass(frozen=True, slots=True)
 class ScoreResult:
@@ -22,15 +29,20 @@ class ScoreResult:
 
     Attributes:
         risk_score: Cumulative score capped at 100.
-        triggered_rules: Names of rules that fired.
+        triggered_rules: Names of rules that fired, in canonical rule order
+            (VELOCITY, HIGH_VALUE_FIRST_PURCHASE, MULTIPLE_DECLINES,
+            GEOGRAPHIC_MISMATCH, UNUSUAL_QUANTITY) regardless of the order
+            the rules were evaluated in.
         is_flagged: ``True`` when ``risk_score >= RISK_SCORE_THRESHOLD``.
-        breakdown: Mapping of rule name to its individual score delta.
+        breakdown: ``(rule_name, score_delta)`` pairs for each rule that
+            fired, in the same canonical order; pass to ``dict()`` for a
+            mapping.
     """
 
     risk_score: int
-    triggered_rules: list[str] = field(default_factory=list)
+    triggered_rules: tuple[str, ...] = ()
     is_flagged: bool = False
-    breakdown: dict[str, int] = field(default_factory=dict)
+    breakdown: tuple[tuple[str, int], ...] = ()
 
 
 class RiskScorer:
@@ -48,6 +60,15 @@ class RiskScorer:
             create_alert(...)
     """
 
+    def __init__(self) -> None:
+        # Resolved once so the per-transaction hot path skips the settings lookup.
+        self._threshold: int = get_settings().RISK_SCORE_THRESHOLD
+
+    @property
+    def threshold(self) -> int:
+        """Minimum capped score at which a transaction is flagged."""
+        return self._threshold
+
     def calculate(self, rule_results: list[RuleResult]) -> ScoreResult:
         """Produce a composite risk score from individual rule evaluations.
 
@@ -58,27 +79,24 @@ class RiskScorer:
             A ``ScoreResult`` containing the capped score, triggered rule
             names, flag status, and per-rule breakdown.
         """
-        triggered_rules: list[str] = []
-        breakdown: dict[str, int] = {}
-        raw_score: int = 0
-
-        for result in rule_results:
-            if result.triggered:
-                triggered_rules.append(result.rule_name)
-                breakdown[result.rule_name] = result.score_delta
-                raw_score += result.score_delta
-
-        capped_score = min(raw_score, 100)
-        is_flagged = capped_score >= settings.RISK_SCORE_THRESHOLD
-
-        logger.info(
-            "Risk score: %d (raw=%d, capped=%d, flagged=%s, rules=%s)",
-            capped_score,
-            raw_score,
-            capped_score,
-            is_flagged,
-            triggered_rules,
-        )
+        triggered = [result for result in rule_results if result.triggered]
+        triggered_rules = tuple(result.rule_name for result in triggered)
+        breakdown = tuple((result.rule_name, result.score_delta) for result in triggered)
+        raw_score: int = sum(result.score_delta for result in triggered)
+
+        capped_score = min(raw_score, SCORE_CAP)
+        is_flagged = capped_score >= self._threshold
+
+        # Runs once per transaction: skip building the args when INFO is off.
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Risk score: %d (raw=%d, capped=%d, flagged=%s, rules=%s)",
+                capped_score,
+                raw_score,
+                capped_score,
+                is_flagged,
+                triggered_rules,
+            )
 
         return ScoreResult(
             risk_score=capped_score,
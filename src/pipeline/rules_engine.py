@@ -15,17 +15,56 @@ Rules:
 from __future__ import annotations
 
 import logging
+import time
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Sequence
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Final
 
-from sqlalchemy import func, select
+from sqlalchemy import bindparam, func, literal_column, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.config import settings
-from src.models.database import Transaction
+from src.config import get_settings
+from src.models.database import Transaction, TransactionStatus
+from src.pipeline.risk_scorer import SCORE_CAP, ScoreResult
+
+if TYPE_CHECKING:
+    from sqlalchemy import ColumnElement
+    from sqlalchemy.sql.selectable import ScalarSelect
 
 logger = logging.getLogger(__name__)
 
+# Product categories the UNUSUAL_QUANTITY rule treats as high value.
+_HIGH_VALUE_CATEGORIES: Final[frozenset[str]] = frozenset({"LAPTOP", "SMARTPHONE", "CAMERA"})
+
+# Statuses counted by the MULTIPLE_DECLINES rule.
+_DECLINED_STATUSES: Final[tuple[TransactionStatus, ...]] = (
+    TransactionStatus.SOFT_DECLINED,
+    TransactionStatus.HARD_DECLINED,
+)
+
+# Prior declines at which MULTIPLE_DECLINES fires.
+_DECLINE_THRESHOLD: Final[int] = 3
+
+# Canonical rule order, used for ``triggered_rules`` regardless of the order
+# in which the rules were evaluated.
+_RULE_ORDER: dict[str, int] = {
+    "VELOCITY": 0,
+    "HIGH_VALUE_FIRST_PURCHASE": 1,
+    "MULTIPLE_DECLINES": 2,
+    "GEOGRAPHIC_MISMATCH": 3,
+    "UNUSUAL_QUANTITY": 4,
+}
+
+# Name under which ``PROFILE_RULES`` records the shared history query.
+HISTORY_QUERY_STAT: Final[str] = "HISTORY_QUERY"
+
+# Per-rule profile shared by every engine in the process, filled only when
+# ``PROFILE_RULES`` is enabled: name -> [calls, triggers, total_ns].
+_RULE_STATS: defaultdict[str, list[int]] = defaultdict(lambda: [0, 0, 0])
+
 
 @dataclass(frozen=True, slots=True)
 class RuleResult:
@@ -44,6 +83,177 @@ class RuleResult:
     reason: str
 
 
+# ---------------------------------------------------------------------------
+# History queries
+# ---------------------------------------------------------------------------
+# Built once with bind parameters, so each call only binds values against the
+# engine's cached compiled form instead of rebuilding the statement.
+
+
+def _bounded_count(*criteria: ColumnElement[bool], limit: str) -> ScalarSelect[int]:
+    """Count matching transactions, stopping after ``limit`` rows.
+
+    Args:
+        *criteria: ``WHERE`` clauses over ``transactions``.
+        limit: Name of the bind parameter holding the row cap.
+
+    Returns:
+        A ``count(*)`` scalar subquery over a ``LIMIT``-ed row subquery, so
+        the index walk ends as soon as the rule outcome is known.
+    """
+    rows = select(literal_column("1")).where(*criteria).limit(bindparam(limit)).subquery()
+    return select(func.count()).select_from(rows).scalar_subquery()
+
+
+# Transactions in the velocity window up to and including the reference time.
+_VELOCITY_CRITERIA: Final = (
+    Transaction.customer_email == bindparam("customer_email"),
+    Transaction.timestamp >= bindparam("velocity_cutoff"),
+    Transaction.timestamp <= bindparam("ref_time"),
+)
+# Declined transactions in the decline window strictly before it.
+_DECLINED_CRITERIA: Final = (
+    Transaction.customer_email == bindparam("customer_email"),
+    Transaction.timestamp >= bindparam("decline_cutoff"),
+    Transaction.timestamp < bindparam("ref_time"),
+    Transaction.status.in_(_DECLINED_STATUSES),
+)
+_VELOCITY_COUNT: Final = _bounded_count(*_VELOCITY_CRITERIA, limit="velocity_limit")
+_DECLINED_COUNT: Final = _bounded_count(*_DECLINED_CRITERIA, limit="decline_limit")
+_VELOCITY_COUNT_STMT: Final = select(_VELOCITY_COUNT)
+_COUNTERS_STMT: Final = select(_VELOCITY_COUNT, _DECLINED_COUNT).params(
+    decline_limit=_DECLINE_THRESHOLD,
+)
+# Unbounded counts, only run once a bounded count shows the rule fires so
+# the reason can report the real number.
+_VELOCITY_EXACT_STMT: Final = select(func.count()).where(*_VELOCITY_CRITERIA)
+_DECLINED_EXACT_STMT: Final = select(func.count()).where(*_DECLINED_CRITERIA)
+
+# Index entries of a set of customers over a time span (batch scoring).
+_BATCH_HISTORY_STMT: Final = (
+    select(Transaction.customer_email, Transaction.timestamp, Transaction.status)
+    .where(
+        Transaction.customer_email.in_(bindparam("customer_emails", expanding=True)),
+        Transaction.timestamp >= bindparam("start"),
+        Transaction.timestamp <= bindparam("end"),
+    )
+    .order_by(Transaction.customer_email, Transaction.timestamp)
+)
+
+
+def _reference_time(tx: Transaction) -> datetime:
+    """Return the timestamp the rule windows are measured back from.
+
+    The transaction's own event time is used (not ``now``), so historical
+    data replays evaluate as they would have live.
+
+    Args:
+        tx: The transaction being evaluated.
+
+    Returns:
+        ``tx.timestamp``, with naive values (as loaded from the ``DateTime``
+        column) taken to be UTC.
+    """
+    timestamp = tx.timestamp
+    return timestamp if timestamp.tzinfo is not None else timestamp.replace(tzinfo=timezone.utc)
+
+
+# ---------------------------------------------------------------------------
+# Profiling (PROFILE_RULES)
+# ---------------------------------------------------------------------------
+
+RuleMethod = Callable[..., Awaitable[RuleResult]]
+
+
+def _record_stat(name: str, triggered: bool, start_ns: int) -> None:
+    """Add one call to the profile counters of ``name``.
+
+    Args:
+        name: Rule name, or ``HISTORY_QUERY_STAT``.
+        triggered: Whether the rule fired.
+        start_ns: ``time.perf_counter_ns()`` taken before the call.
+    """
+    stats = _RULE_STATS[name]
+    stats[0] += 1
+    stats[1] += triggered
+    stats[2] += time.perf_counter_ns() - start_ns
+
+
+def _profiled(rule: RuleMethod) -> RuleMethod:
+    """Wrap a rule method so each call is recorded in the profile counters.
+
+    Args:
+        rule: A bound ``evaluate_*`` rule method.
+
+    Returns:
+        An async callable with the same signature and result.
+    """
+    async def profiled_rule(*args: Any) -> RuleResult:  # noqa: ANN401
+        start = time.perf_counter_ns()
+        result = await rule(*args)
+        _record_stat(result.rule_name, result.triggered, start)
+        return result
+
+    return profiled_rule
+
+
+def rule_stats() -> dict[str, dict[str, int]]:
+    """Return a snapshot of the ``PROFILE_RULES`` counters.
+
+    The database rules take their counts from one shared history query, so
+    their own entries only cover the threshold checks; the query itself is
+    reported under ``HISTORY_QUERY_STAT``.
+
+    Returns:
+        ``{name: {"calls", "triggers", "total_ns", "mean_ns"}}``; empty when
+        profiling is disabled or nothing has been evaluated yet.
+    """
+    return {
+        name: {
+            "calls": calls,
+            "triggers": triggers,
+            "total_ns": total_ns,
+            "mean_ns": total_ns // calls if calls else 0,
+        }
+        for name, (calls, triggers, total_ns) in _RULE_STATS.items()
+    }
+
+
+# Shared results for the common "rule did not fire" outcome.  RuleResult is
+# frozen, so one instance per rule can be returned for every transaction
+# instead of allocating a result and formatting its reason each time.
+_NOT_TRIGGERED_VELOCITY: Final = RuleResult(
+    rule_name="VELOCITY",
+    triggered=False,
+    score_delta=0,
+    reason="Transaction count within the velocity threshold",
+)
+_NOT_TRIGGERED_HIGH_VALUE_FIRST: Final = RuleResult(
+    rule_name="HIGH_VALUE_FIRST_PURCHASE",
+    triggered=False,
+    score_delta=0,
+    reason="Not a high-value first purchase",
+)
+_NOT_TRIGGERED_MULTIPLE_DECLINES: Final = RuleResult(
+    rule_name="MULTIPLE_DECLINES",
+    triggered=False,
+    score_delta=0,
+    reason="Not an APPROVED transaction preceded by 3+ recent declines",
+)
+_NOT_TRIGGERED_GEOGRAPHIC_MISMATCH: Final = RuleResult(
+    rule_name="GEOGRAPHIC_MISMATCH",
+    triggered=False,
+    score_delta=0,
+    reason="Billing country == shipping country",
+)
+_NOT_TRIGGERED_UNUSUAL_QUANTITY: Final = RuleResult(
+    rule_name="UNUSUAL_QUANTITY",
+    triggered=False,
+    score_delta=0,
+    reason="Quantity within threshold or category not in high-value set",
+)
+
+
 class RulesEngine:
     """Orchestrates evaluation of all fraud detection rules against a transaction.
 
@@ -53,10 +263,169 @@ class RulesEngine:
         results = await engine.evaluate_all(transaction, session)
     """
 
+    __slots__ = (
+        "_velocity_window_minutes",
+        "_velocity_window",
+        "_velocity_max",
+        "_decline_window_hours",
+        "_decline_window",
+        "_high_value_threshold",
+        "_quantity_threshold",
+        "_pure_rules",
+        "_db_rules",
+        "_profile",
+    )
+
+    def __init__(self) -> None:
+        # Rule thresholds are snapshotted once so evaluations read plain
+        # attributes instead of going back to the settings object.
+        settings = get_settings()
+        self._velocity_window_minutes: int = settings.VELOCITY_WINDOW_MINUTES
+        self._velocity_window = timedelta(minutes=settings.VELOCITY_WINDOW_MINUTES)
+        self._velocity_max: int = settings.VELOCITY_MAX_TRANSACTIONS
+        self._decline_window_hours: int = settings.DECLINE_WINDOW_HOURS
+        self._decline_window = timedelta(hours=settings.DECLINE_WINDOW_HOURS)
+        self._high_value_threshold: float = settings.HIGH_VALUE_THRESHOLD
+        self._quantity_threshold: int = settings.UNUSUAL_QUANTITY_THRESHOLD
+
+        # Field-only rules in the order ``evaluate_and_score`` runs them.
+        # The database rules follow, sharing a single history query (see
+        # ``_fetch_email_counters``).
+        self._pure_rules = (
+            self.evaluate_high_value_first,     # 35
+            self.evaluate_geographic_mismatch,  # 20
+            self.evaluate_unusual_quantity,     # 15
+        )
+        # History rules, each taking its count from the shared query as the
+        # third argument, in ``_fetch_email_counters`` result order.
+        self._db_rules = (
+            self.evaluate_velocity,             # 30
+            self.evaluate_multiple_declines,    # 25
+        )
+
+        # Profiling wraps the rule callables once here, so with it disabled
+        # the evaluation paths carry no instrumentation at all.
+        self._profile: bool = settings.PROFILE_RULES
+        if self._profile:
+            self._pure_rules = tuple(_profiled(rule) for rule in self._pure_rules)
+            self._db_rules = tuple(_profiled(rule) for rule in self._db_rules)
+
+    async def _fetch_email_counters(
+        self,
+        tx: Transaction,
+        session: AsyncSession,
+        include_declines: bool = True,
+    ) -> tuple[int, int]:
+        """Count the customer's recent and recently declined transactions.
+
+        One ``SELECT`` carries both counts as scalar subqueries over the
+        customer's ``(customer_email, timestamp, status)`` index range.
+        Each subquery is ``LIMIT``-ed to one row past its rule threshold,
+        so the index walk stops as soon as the outcome is known instead of
+        covering the whole window.  Only when a count reaches its cap (the
+        rule fires) is it re-run unbounded, so triggered reasons report the
+        exact number.
+
+        Args:
+            tx: The transaction being evaluated.
+            session: Active async database session.
+            include_declines: When ``False`` the declined subquery is left
+                out and ``declined_count`` is returned as ``0``.
+
+        Returns:
+            ``(velocity_count, declined_count)``: transactions in the
+            velocity window up to and including ``tx``, and declined
+            transactions in the decline window strictly before it.  Either
+            count is exact once it reaches its rule threshold; below it the
+            value is exact anyway.
+        """
+        # Use the transaction's own timestamp as reference (supports historical data replay)
+        ref_time = _reference_time(tx)
+        velocity_cutoff = ref_time - self._velocity_window
+        decline_cutoff = ref_time - self._decline_window
+
+        params = {
+            "customer_email": tx.customer_email,
+            "ref_time": ref_time,
+            "velocity_cutoff": velocity_cutoff,
+            "velocity_limit": self._velocity_max + 1,
+        }
+        if not include_declines:
+            velocity_count = await session.scalar(_VELOCITY_COUNT_STMT, params) or 0
+            declined_count = 0
+        else:
+            params["decline_cutoff"] = decline_cutoff
+            velocity_count, declined_count = (await session.execute(_COUNTERS_STMT, params)).one()
+            velocity_count, declined_count = velocity_count or 0, declined_count or 0
+
+        if velocity_count > self._velocity_max:
+            velocity_count = await session.scalar(_VELOCITY_EXACT_STMT, params) or 0
+        if declined_count >= _DECLINE_THRESHOLD:
+            declined_count = await session.scalar(_DECLINED_EXACT_STMT, params) or 0
+        return velocity_count, declined_count
+
+    async def _fetch_batch_counters(
+        self,
+        txs: Sequence[Transaction],
+        session: AsyncSession,
+    ) -> list[tuple[int, int]]:
+        """Compute ``_fetch_email_counters`` for many transactions at once.
+
+        One query reads the ``(customer_email, timestamp, status)`` index
+        entries of every customer in the batch over the span the batch's
+        windows cover; each transaction's counts are then taken from the
+        sorted timestamps with ``bisect``.  Every transaction must already
+        be visible in ``session``.
+
+        Args:
+            txs: The transactions being evaluated.
+            session: Active async database session.
+
+        Returns:
+            One ``(velocity_count, declined_count)`` pair per transaction,
+            in input order, exact like ``_fetch_email_counters``.
+        """
+        if not txs:
+            return []
+
+        # Compared as naive values, the form the column stores and returns, so
+        # the fetched history rows need no per-row conversion.
+        ref_times = [_reference_time(tx).replace(tzinfo=None) for tx in txs]
+        window = max(self._velocity_window, self._decline_window)
+        rows = await session.execute(
+            _BATCH_HISTORY_STMT,
+            {
+                "customer_emails": list({tx.customer_email for tx in txs}),
+                "start": min(ref_times) - window,
+                "end": max(ref_times),
+            },
+        )
+
+        # Per customer: all timestamps, and the declined ones, both sorted.
+        history: dict[str, tuple[list[datetime], list[datetime]]] = {}
+        for email, ts, status in rows:
+            all_ts, declined_ts = history.setdefault(email, ([], []))
+            all_ts.append(ts)
+            if status in _DECLINED_STATUSES:
+                declined_ts.append(ts)
+
+        counters: list[tuple[int, int]] = []
+        for tx, ref_time in zip(txs, ref_times):
+            all_ts, declined_ts = history.get(tx.customer_email, ([], []))
+            velocity_count = bisect_right(all_ts, ref_time) - bisect_left(
+                all_ts, ref_time - self._velocity_window,
+            )
+            declined_count = bisect_left(declined_ts, ref_time) - bisect_left(
+                declined_ts, ref_time - self._decline_window,
+            )
+            counters.append((velocity_count, declined_count))
+        return counters
+
     async def evaluate_velocity(
         self,
         tx: Transaction,
         session: AsyncSession,
+        count: int | None = None,
     ) -> RuleResult:
         """Evaluate the VELOCITY rule.
 
@@ -67,46 +436,35 @@ class RulesEngine:
         Args:
             tx: The transaction being evaluated.
             session: Active async database session.
+            count: Velocity count already fetched by
+                ``_fetch_email_counters``; queried when omitted.
 
         Returns:
             A ``RuleResult`` indicating whether velocity was exceeded.
         """
-        # Use the transaction's own timestamp as reference (supports historical data replay)
-        ref_time = tx.timestamp if tx.timestamp.tzinfo else tx.timestamp.replace(tzinfo=timezone.utc)
-        cutoff = ref_time - timedelta(
-            minutes=settings.VELOCITY_WINDOW_MINUTES,
-        )
-
-        stmt = (
-            select(func.count())
-            .select_from(Transaction)
-            .where(
-                Transaction.customer_email == tx.customer_email,
-                Transaction.timestamp >= cutoff,
-                Transaction.timestamp <= ref_time,
-            )
-        )
-        count: int = await session.scalar(stmt) or 0
-
-        triggered = count > settings.VELOCITY_MAX_TRANSACTIONS
-        reason = (
-            f"Found {count} transactions from {tx.customer_email} in the last "
-            f"{settings.VELOCITY_WINDOW_MINUTES} minutes "
-            f"(threshold: {settings.VELOCITY_MAX_TRANSACTIONS})"
-        )
-
-        logger.debug("VELOCITY rule: count=%d, triggered=%s", count, triggered)
+        if count is None:
+            count, _ = await self._fetch_email_counters(tx, session)
+
+        triggered = count > self._velocity_max
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("VELOCITY rule: count=%d, triggered=%s", count, triggered)
+        if not triggered:
+            return _NOT_TRIGGERED_VELOCITY
         return RuleResult(
             rule_name="VELOCITY",
-            triggered=triggered,
-            score_delta=30 if triggered else 0,
-            reason=reason,
+            triggered=True,
+            score_delta=30,
+            reason=(
+                f"Found {count} transactions from {tx.customer_email} in the last "
+                f"{self._velocity_window_minutes} minutes "
+                f"(threshold: {self._velocity_max})"
+            ),
         )
 
     async def evaluate_high_value_first(
         self,
         tx: Transaction,
-        session: AsyncSession,
+        session: AsyncSession | None,
     ) -> RuleResult:
         """Evaluate the HIGH_VALUE_FIRST_PURCHASE rule.
 
@@ -116,33 +474,33 @@ class RulesEngine:
         Args:
             tx: The transaction being evaluated.
             session: Active async database session (unused, kept for
-                interface consistency).
+                interface consistency; may be ``None``).
 
         Returns:
             A ``RuleResult`` for the high-value first-purchase check.
         """
         triggered = (
-            tx.amount_usd > settings.HIGH_VALUE_THRESHOLD and tx.is_first_purchase
+            tx.amount_usd > self._high_value_threshold and tx.is_first_purchase
         )
-        reason = (
-            f"Amount ${tx.amount_usd:.2f} "
-            f"{'exceeds' if tx.amount_usd > settings.HIGH_VALUE_THRESHOLD else 'within'} "
-            f"threshold ${settings.HIGH_VALUE_THRESHOLD:.2f}, "
-            f"first_purchase={tx.is_first_purchase}"
-        )
-
-        logger.debug("HIGH_VALUE_FIRST_PURCHASE rule: triggered=%s", triggered)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("HIGH_VALUE_FIRST_PURCHASE rule: triggered=%s", triggered)
+        if not triggered:
+            return _NOT_TRIGGERED_HIGH_VALUE_FIRST
         return RuleResult(
             rule_name="HIGH_VALUE_FIRST_PURCHASE",
-            triggered=triggered,
-            score_delta=35 if triggered else 0,
-            reason=reason,
+            triggered=True,
+            score_delta=35,
+            reason=(
+                f"Amount ${tx.amount_usd:.2f} exceeds "
+                f"threshold ${self._high_value_threshold:.2f}, first_purchase=True"
+            ),
         )
 
     async def evaluate_multiple_declines(
         self,
         tx: Transaction,
         session: AsyncSession,
+        declined_count: int | None = None,
     ) -> RuleResult:
         """Evaluate the MULTIPLE_DECLINES rule.
 
@@ -153,59 +511,42 @@ class RulesEngine:
         Args:
             tx: The transaction being evaluated.
             session: Active async database session.
+            declined_count: Declined count already fetched by
+                ``_fetch_email_counters``; queried when omitted.
 
         Returns:
             A ``RuleResult`` for the multiple-declines check.
         """
-        if tx.status != "APPROVED":
-            return RuleResult(
-                rule_name="MULTIPLE_DECLINES",
-                triggered=False,
-                score_delta=0,
-                reason=f"Transaction status is {tx.status}, rule only applies to APPROVED",
+        if tx.status != TransactionStatus.APPROVED:
+            return _NOT_TRIGGERED_MULTIPLE_DECLINES
+
+        if declined_count is None:
+            _, declined_count = await self._fetch_email_counters(tx, session)
+
+        triggered = declined_count >= _DECLINE_THRESHOLD
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "MULTIPLE_DECLINES rule: declined_count=%d, triggered=%s",
+                declined_count,
+                triggered,
             )
-
-        # Use the transaction's own timestamp as reference (supports historical data replay)
-        ref_time = tx.timestamp if tx.timestamp.tzinfo else tx.timestamp.replace(tzinfo=timezone.utc)
-        cutoff = ref_time - timedelta(
-            hours=settings.DECLINE_WINDOW_HOURS,
-        )
-
-        stmt = (
-            select(func.count())
-            .select_from(Transaction)
-            .where(
-                Transaction.customer_email == tx.customer_email,
-                Transaction.status.in_(["SOFT_DECLINED", "HARD_DECLINED"]),
-                Transaction.timestamp >= cutoff,
-                Transaction.timestamp < ref_time,
-            )
-        )
-        declined_count: int = await session.scalar(stmt) or 0
-
-        triggered = declined_count >= 3
-        reason = (
-            f"Found {declined_count} declined transactions from "
-            f"{tx.customer_email} in the last {settings.DECLINE_WINDOW_HOURS} hour(s) "
-            f"(threshold: 3)"
-        )
-
-        logger.debug(
-            "MULTIPLE_DECLINES rule: declined_count=%d, triggered=%s",
-            declined_count,
-            triggered,
-        )
+        if not triggered:
+            return _NOT_TRIGGERED_MULTIPLE_DECLINES
         return RuleResult(
             rule_name="MULTIPLE_DECLINES",
-            triggered=triggered,
-            score_delta=25 if triggered else 0,
-            reason=reason,
+            triggered=True,
+            score_delta=25,
+            reason=(
+                f"Found {declined_count} declined transactions from "
+                f"{tx.customer_email} in the last {self._decline_window_hours} hour(s) "
+                f"(threshold: {_DECLINE_THRESHOLD})"
+            ),
         )
 
     async def evaluate_geographic_mismatch(
         self,
         tx: Transaction,
-        session: AsyncSession,
+        session: AsyncSession | None,
     ) -> RuleResult:
         """Evaluate the GEOGRAPHIC_MISMATCH rule.
 
@@ -215,30 +556,30 @@ class RulesEngine:
         Args:
             tx: The transaction being evaluated.
             session: Active async database session (unused, kept for
-                interface consistency).
+                interface consistency; may be ``None``).
 
         Returns:
             A ``RuleResult`` for the geographic mismatch check.
         """
         triggered = tx.billing_country != tx.shipping_country
-        reason = (
-            f"Billing country ({tx.billing_country}) "
-            f"{'!=' if triggered else '=='} "
-            f"shipping country ({tx.shipping_country})"
-        )
-
-        logger.debug("GEOGRAPHIC_MISMATCH rule: triggered=%s", triggered)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("GEOGRAPHIC_MISMATCH rule: triggered=%s", triggered)
+        if not triggered:
+            return _NOT_TRIGGERED_GEOGRAPHIC_MISMATCH
         return RuleResult(
             rule_name="GEOGRAPHIC_MISMATCH",
-            triggered=triggered,
-            score_delta=20 if triggered else 0,
-            reason=reason,
+            triggered=True,
+            score_delta=20,
+            reason=(
+                f"Billing country ({tx.billing_country}) != "
+                f"shipping country ({tx.shipping_country})"
+            ),
         )
 
     async def evaluate_unusual_quantity(
         self,
         tx: Transaction,
-        session: AsyncSession,
+        session: AsyncSession | None,
     ) -> RuleResult:
         """Evaluate the UNUSUAL_QUANTITY rule.
 
@@ -248,34 +589,80 @@ class RulesEngine:
         Args:
             tx: The transaction being evaluated.
             session: Active async database session (unused, kept for
-                interface consistency).
+                interface consistency; may be ``None``).
 
         Returns:
             A ``RuleResult`` for the unusual quantity check.
         """
-        high_value_categories = {"LAPTOP", "SMARTPHONE", "CAMERA"}
         triggered = (
-            tx.quantity > settings.UNUSUAL_QUANTITY_THRESHOLD
-            and tx.product_category in high_value_categories
-        )
-        reason = (
-            f"Quantity {tx.quantity} of {tx.product_category} "
-            f"{'exceeds' if tx.quantity > settings.UNUSUAL_QUANTITY_THRESHOLD else 'within'} "
-            f"threshold {settings.UNUSUAL_QUANTITY_THRESHOLD}"
-            + (
-                f", category {'in' if tx.product_category in high_value_categories else 'not in'} "
-                f"high-value set"
-            )
+            tx.quantity > self._quantity_threshold
+            and tx.product_category in _HIGH_VALUE_CATEGORIES
         )
-
-        logger.debug("UNUSUAL_QUANTITY rule: triggered=%s", triggered)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("UNUSUAL_QUANTITY rule: triggered=%s", triggered)
+        if not triggered:
+            return _NOT_TRIGGERED_UNUSUAL_QUANTITY
         return RuleResult(
             rule_name="UNUSUAL_QUANTITY",
-            triggered=triggered,
-            score_delta=15 if triggered else 0,
-            reason=reason,
+            triggered=True,
+            score_delta=15,
+            reason=(
+                f"Quantity {tx.quantity} of {tx.product_category} exceeds "
+                f"threshold {self._quantity_threshold}, category in high-value set"
+            ),
         )
 
+    async def evaluate_pure(self, tx: Transaction) -> list[RuleResult]:
+        """Run the rules that only read the transaction's own fields.
+
+        These never touch the database, so they can run before the row is
+        persisted -- or on a transient ``Transaction`` that never is.
+
+        Args:
+            tx: The transaction to evaluate.
+
+        Returns:
+            HIGH_VALUE_FIRST_PURCHASE, GEOGRAPHIC_MISMATCH and UNUSUAL_QUANTITY
+            results, in that order.
+        """
+        return [await rule(tx, None) for rule in self._pure_rules]
+
+    async def evaluate_db(
+        self,
+        tx: Transaction,
+        session: AsyncSession,
+        counters: tuple[int, int] | None = None,
+    ) -> list[RuleResult]:
+        """Run the rules that query the customer's transaction history.
+
+        The transaction itself must already be visible in ``session``:
+        VELOCITY counts it towards the window.  Both rules are answered by a
+        single history query.
+
+        Args:
+            tx: The transaction to evaluate.
+            session: Active async database session.
+            counters: ``(velocity_count, declined_count)`` already fetched
+                for ``tx`` (see ``evaluate_batch_and_score``); queried when
+                omitted.
+
+        Returns:
+            VELOCITY and MULTIPLE_DECLINES results, in that order.
+        """
+        # MULTIPLE_DECLINES only applies to APPROVED transactions, so the
+        # declined subquery is skipped for everything else.
+        if counters is None:
+            start = time.perf_counter_ns() if self._profile else 0
+            counters = await self._fetch_email_counters(
+                tx, session, include_declines=tx.status == TransactionStatus.APPROVED
+            )
+            if self._profile:
+                _record_stat(HISTORY_QUERY_STAT, False, start)
+        return [
+            await rule(tx, session, count)
+            for rule, count in zip(self._db_rules, counters)
+        ]
+
     async def evaluate_all(
         self,
         tx: Transaction,
@@ -284,7 +671,8 @@ class RulesEngine:
         """Run every fraud detection rule against a single transaction.
 
         Rules are evaluated sequentially to maintain deterministic ordering
-        and consistent database reads.
+        and consistent database reads.  Use ``evaluate_pure`` and
+        ``evaluate_db`` directly when only one group is needed.
 
         Args:
             tx: The transaction to evaluate.
@@ -293,21 +681,104 @@ class RulesEngine:
         Returns:
             A list of ``RuleResult`` objects, one per rule.
         """
-        logger.info(
-            "Evaluating all rules for transaction %s", tx.transaction_id,
+        log_info = logger.isEnabledFor(logging.INFO)
+        if log_info:
+            logger.info("Evaluating all rules for transaction %s", tx.transaction_id)
+        results = [*await self.evaluate_pure(tx), *await self.evaluate_db(tx, session)]
+        results.sort(key=lambda result: _RULE_ORDER[result.rule_name])
+        if log_info:
+            triggered_names = [r.rule_name for r in results if r.triggered]
+            logger.info(
+                "Transaction %s triggered %d rule(s): %s",
+                tx.transaction_id,
+                len(triggered_names),
+                triggered_names,
+            )
+        return results
+
+    async def evaluate_and_score(
+        self,
+        tx: Transaction,
+        session: AsyncSession,
+        threshold: int,
+        counters: tuple[int, int] | None = None,
+    ) -> ScoreResult:
+        """Run the rules and reduce the results to a score in a single pass.
+
+        Equivalent to ``RiskScorer.calculate(await evaluate_all(...))`` but
+        accumulates the score, triggered rule names and breakdown as each
+        rule returns, without building the intermediate result list.
+
+        The field-only rules run first, then the database rules from one
+        shared history query.  Every rule is evaluated and recorded: the
+        field-only rules total 70, below ``SCORE_CAP``, so there is never a
+        point at which the history query could be skipped.
+
+        Args:
+            tx: The transaction to evaluate.
+            session: Active async database session.
+            threshold: Minimum capped score at which the transaction is
+                flagged (``RiskScorer.threshold``).
+            counters: Pre-fetched history counts, passed through to
+                ``evaluate_db``.
+
+        Returns:
+            The composite ``ScoreResult``, with triggered rules listed in
+            canonical order.
+        """
+        raw_score = 0
+        breakdown: list[tuple[str, int]] = []
+        for rule in self._pure_rules:
+            result = await rule(tx, None)
+            if result.triggered:
+                raw_score += result.score_delta
+                breakdown.append((result.rule_name, result.score_delta))
+        for result in await self.evaluate_db(tx, session, counters):
+            if result.triggered:
+                raw_score += result.score_delta
+                breakdown.append((result.rule_name, result.score_delta))
+
+        if len(breakdown) > 1:
+            breakdown.sort(key=lambda item: _RULE_ORDER[item[0]])
+        capped_score = min(raw_score, SCORE_CAP)
+        return ScoreResult(
+            risk_score=capped_score,
+            triggered_rules=tuple(name for name, _ in breakdown),
+            is_flagged=capped_score >= threshold,
+            breakdown=tuple(breakdown),
         )
-        results: list[RuleResult] = [
-            await self.evaluate_velocity(tx, session),
-            await self.evaluate_high_value_first(tx, session),
-            await self.evaluate_multiple_declines(tx, session),
-            await self.evaluate_geographic_mismatch(tx, session),
-            await self.evaluate_unusual_quantity(tx, session),
+
+    async def evaluate_batch_and_score(
+        self,
+        txs: Sequence[Transaction],
+        session: AsyncSession,
+        threshold: int,
+    ) -> list[ScoreResult]:
+        """Score a batch of transactions with one history query in total.
+
+        Same results as calling ``evaluate_and_score`` per transaction once
+        the whole batch is visible in ``session``, but the VELOCITY and
+        MULTIPLE_DECLINES counts for every row come from a single
+        ``_fetch_batch_counters`` round trip instead of one query each.
+
+        Counts are taken by event time, so a row also sees batch mates with
+        an earlier ``timestamp`` that appear after it in the feed; for a
+        time-ordered feed this is identical to row-at-a-time processing.
+
+        Args:
+            txs: The transactions to evaluate, already persisted.
+            session: Active async database session.
+            threshold: Minimum capped score at which a transaction is
+                flagged (``RiskScorer.threshold``).
+
+        Returns:
+            One ``ScoreResult`` per transaction, in input order.
+        """
+        start = time.perf_counter_ns() if self._profile else 0
+        counters = await self._fetch_batch_counters(txs, session)
+        if self._profile:
+            _record_stat(HISTORY_QUERY_STAT, False, start)
+        return [
+            await self.evaluate_and_score(tx, session, threshold, counters=tx_counters)
+            for tx, tx_counters in zip(txs, counters)
         ]
-        triggered_names = [r.rule_name for r in results if r.triggered]
-        logger.info(
-            "Transaction %s triggered %d rule(s): %s",
-            tx.transaction_id,
-            len(triggered_names),
-            triggered_names,
-        )
-        return results
@@ -11,15 +11,27 @@ SkyMart Fraud Detection System:
 - ``RelatedTransactionsResponse``— related transactions grouped by email / IP / BIN.
 
 All models use ``from __future__ import annotations`` for deferred evaluation
-of type hints, enabling forward references within the same module.
+of type hints, enabling forward references within the same module.  They are
+frozen: instances are built once per response (or cached, for metrics) and
+never mutated afterwards.
 """
 
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from src.models.database import TransactionStatus
+
+# Closed value sets for enum-like string fields.  Literal fields are checked
+# against the allowed values during validation and are listed in the OpenAPI
+# schema.
+PaymentMethod = Literal["CREDIT_CARD", "GOPAY", "OVO", "BANK_TRANSFER"]
+ProductCategory = Literal["LAPTOP", "SMARTPHONE", "CAMERA", "ACCESSORIES"]
+AlertStatus = Literal["NEW", "NEEDS_REVIEW", "INVESTIGATED", "CLEARED", "CONFIRMED_FRAUD"]
+
 
 class TransactionCreate(BaseModel):
     """Schema for creating or ingesting a new transaction.
@@ -81,7 +93,7 @@ class TransactionCreate(BaseModel):
         default=None,
         description="First six digits of the payment card.  Null for non-card methods.",
     )
-    payment_method: str = Field(
+    payment_method: PaymentMethod = Field(
         ...,
         description="Payment instrument: CREDIT_CARD, GOPAY, OVO, or BANK_TRANSFER.",
     )
@@ -89,11 +101,11 @@ class TransactionCreate(BaseModel):
         ...,
         description="Total transaction amount in United States Dollars.",
     )
-    status: str = Field(
+    status: TransactionStatus = Field(
         ...,
         description="Transaction outcome: APPROVED, SOFT_DECLINED, or HARD_DECLINED.",
     )
-    product_category: str = Field(
+    product_category: ProductCategory = Field(
         ...,
         description="Product category: LAPTOP, SMARTPHONE, CAMERA, or ACCESSORIES.",
     )
@@ -114,6 +126,8 @@ class TransactionCreate(BaseModel):
         description="True when this is the customer's first-ever purchase.",
     )
 
+    model_config = ConfigDict(frozen=True)
+
 
 class TransactionResponse(TransactionCreate):
     """Schema for a transaction as returned by the API.
@@ -134,7 +148,7 @@ class TransactionResponse(TransactionCreate):
         description="Server-side row insertion timestamp.",
     )
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class FraudAlertResponse(BaseModel):
@@ -155,8 +169,8 @@ class FraudAlertResponse(BaseModel):
         triggered_rules: Ordered list of rule label strings that fired.
             Example: ``["VELOCITY", "GEO_MISMATCH"]``.
         alert_status: Current review workflow state.
-            One of: ``NEEDS_REVIEW``, ``INVESTIGATED``, ``CLEARED``,
-            ``CONFIRMED_FRAUD``.
+            One of: ``NEW`` (set on creation), ``NEEDS_REVIEW``,
+            ``INVESTIGATED``, ``CLEARED``, ``CONFIRMED_FRAUD``.
         created_at: Timestamp of alert creation.
         updated_at: Timestamp of the most recent status update.
             ``None`` until the first PATCH request is processed.
@@ -180,10 +194,10 @@ class FraudAlertResponse(BaseModel):
         ...,
         description="Rule labels that contributed to the risk score.",
     )
-    alert_status: str = Field(
+    alert_status: AlertStatus = Field(
         ...,
         description=(
-            "Review workflow state: NEEDS_REVIEW, INVESTIGATED, "
+            "Review workflow state: NEW, NEEDS_REVIEW, INVESTIGATED, "
             "CLEARED, or CONFIRMED_FRAUD."
         ),
     )
@@ -200,7 +214,7 @@ class FraudAlertResponse(BaseModel):
         description="Full transaction detail.  Populated in single-alert responses.",
     )
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class AlertStatusUpdate(BaseModel):
@@ -222,6 +236,8 @@ class AlertStatusUpdate(BaseModel):
         ),
     )
 
+    model_config = ConfigDict(frozen=True)
+
 
 class MetricsResponse(BaseModel):
     """Aggregate metrics for the analyst dashboard.
@@ -296,6 +312,8 @@ class MetricsResponse(BaseModel):
         description="Number of alerts with risk_score >= 80.",
     )
 
+    model_config = ConfigDict(frozen=True)
+
 
 class RelatedTransactionsResponse(BaseModel):
     """Grouped related transactions for a given transaction.
@@ -340,3 +358,5 @@ class RelatedTransactionsResponse(BaseModel):
             "Empty when the primary transaction has no card_bin."
         ),
     )
+
+    model_config = ConfigDict(frozen=True)